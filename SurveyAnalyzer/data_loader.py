@@ -7,10 +7,91 @@ Provides robust error handling and data consistency checks.
 """
 
 import csv
+import io
+import mmap
 import os
 import sys
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress, islice
+from operator import and_
+from utils import available_cpus
+
+
+def _parse_text(text: str, delimiter: str) -> Iterator[List[str]]:
+    """
+    Split decoded CSV text into rows of fields.
+    
+    Without quote characters (and NULs, which csv rejects) a record is exactly
+    one line and a field is exactly the text between delimiters, so such text
+    is split with str.split instead of going through csv.reader. Blank lines
+    yield empty rows, as they do from csv.reader.
+    """
+    if '"' in text or '\0' in text:
+        return csv.reader(io.StringIO(text, newline=''), delimiter=delimiter)
+    
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    if not lines[-1]:
+        lines.pop()
+    return (line.split(delimiter) if line else [] for line in lines)
+
+
+def _split_lines(lines: Iterable[str], delimiter: str) -> Iterator[List[str]]:
+    """
+    Split the lines of unquoted CSV text into rows of fields, as _parse_text
+    does, one line at a time.
+    
+    The lines come from a text stream in universal newlines mode, so each
+    ends in a single '\n' whatever line breaks the file used.
+    """
+    for line in lines:
+        line = line.rstrip('\n')
+        yield line.split(delimiter) if line else []
+
+
+def _parse_byte_range(file_path: str, start: int, end: int, encoding: str,
+                      delimiter: str) -> List[List[str]]:
+    """Parse one newline-aligned byte range of a CSV file (worker process)."""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = mapped[start:end].decode(encoding)
+    return list(_parse_text(text, delimiter))
+
+
+class SurveyFrame(list):
+    """
+    Loaded survey responses with a shared columnar view.
+    
+    Behaves exactly like the list of row dictionaries it holds, so existing
+    row-based code keeps working, and additionally exposes the same data as
+    one list per column. The columns are built once, on first access, and
+    shared by every analyzer that receives the frame; the frame is treated
+    as read-only after loading.
+    """
+    
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()):
+        super().__init__(rows)
+        self._columns = None
+    
+    @property
+    def columns(self) -> Dict[str, List[Any]]:
+        """Column name to list of values (None where a row lacks the column)."""
+        if self._columns is None:
+            keys = {}
+            first_keys = self[0].keys() if self else {}
+            keys.update(dict.fromkeys(first_keys))
+            for row in self:
+                if row.keys() != first_keys:
+                    keys.update(dict.fromkeys(row))
+            self._columns = {key: [row.get(key) for row in self] for key in keys}
+        return self._columns
+    
+    def rows(self) -> List[Dict[str, Any]]:
+        """Return the row dictionaries (the frame itself)."""
+        return self
 
 
 class DataLoader:
@@ -21,6 +102,17 @@ class DataLoader:
         self.required_fields = ['age', 'gender', 'region']  # Common required fields
         self.max_file_size = 50 * 1024 * 1024  # 50MB limit
         self.supported_encodings = ['utf-8', 'latin-1', 'cp1252']
+        self.delimiters = ',;\t|'
+        self.valid_genders = frozenset(['male', 'female', 'm', 'f', 'other', 'prefer not to say'])
+        self.na_values = frozenset(['na', 'n/a', 'null', 'none'])
+        self.na_length = max(map(len, self.na_values))  # Longest NA marker
+        self.parallel_threshold = 16 * 1024 * 1024  # Split files larger than 16MB
+        self.parallel_min_workers = 4  # Fewer workers than this parse slower than one
+        self.max_workers = 8
+        self.chunk_size = 10000  # Rows cleaned per streamed chunk
+        self.verbose = False  # Print each invalid row after validation
+        self.text_columns = []  # Free-text columns of the last loaded file
+        self.numeric_columns = []  # Mostly numeric columns of the last loaded file
         
     def load_csv(self, file_path: str) -> Optional[List[Dict[str, Any]]]:
         """
@@ -32,30 +124,32 @@ class DataLoader:
         Returns:
             List of dictionaries representing survey responses, or None if failed
         """
+        self.text_columns = []
+        self.numeric_columns = []
+        
         try:
             # Validate file exists and is readable
             if not self._validate_file(file_path):
                 return None
                 
-            # Try different encodings
-            data = None
+            # Try each supported encoding in turn. Parse and clean in one
+            # streamed pass, so the raw rows are only ever held one chunk at
+            # a time
+            cleaned_data = None
             for encoding in self.supported_encodings:
-                try:
-                    data = self._read_csv_with_encoding(file_path, encoding)
-                    if data:
-                        break
-                except UnicodeDecodeError:
-                    continue
+                cleaned_data = self._load_with_encoding(file_path, encoding)
+                if cleaned_data is not None:
+                    break
                     
-            if not data:
+            if cleaned_data is None:
                 print("ERROR: Could not read file with any supported encoding")
                 return None
                 
-            # Validate and clean data
-            cleaned_data = self._clean_and_validate_data(data)
             if not cleaned_data:
                 return None
                 
+            cleaned_data = SurveyFrame(cleaned_data)
+            self._detect_column_types(cleaned_data)
             print(f"SUCCESS: Data validation completed successfully")
             return cleaned_data
             
@@ -93,86 +187,231 @@ class DataLoader:
     def _read_csv_with_encoding(self, file_path: str, encoding: str) -> Optional[List[Dict[str, Any]]]:
         """Read CSV file with specified encoding."""
         try:
-            with open(file_path, 'r', encoding=encoding, newline='') as file:
-                # Try to detect delimiter
-                sample = file.read(1024)
-                file.seek(0)
-                
-                # Common delimiters to try
-                delimiters = [',', ';', '\t', '|']
-                detected_delimiter = ','
-                
-                for delimiter in delimiters:
-                    if delimiter in sample:
-                        detected_delimiter = delimiter
-                        break
-                
-                reader = csv.DictReader(file, delimiter=detected_delimiter)
-                data = list(reader)
-                
-                if not data:
-                    print("ERROR: No data found in CSV file")
-                    return None
-                    
-                print(f"SUCCESS: Loaded {len(data)} rows with {len(data[0])} columns")
-                print(f"INFO: Columns: {', '.join(data[0].keys())}")
+            data = list(self._iter_csv_records(file_path, encoding))
+            
+            if not data:
+                print("ERROR: No data found in CSV file")
+                return None
                 
-                return data
+            self._report_loaded(len(data), data[0])
+            return data
                 
         except Exception as e:
             print(f"ERROR: Error reading CSV with {encoding} encoding: {str(e)}")
             return None
     
-    def _clean_and_validate_data(self, data: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
-        """Clean and validate the loaded data."""
+    def _load_with_encoding(self, file_path: str, encoding: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read, clean and validate a CSV file as one streamed pipeline.
+        
+        Returns None if the file could not be read with this encoding, or the
+        (possibly empty) list of valid cleaned rows otherwise. A file that does
+        not decode with the encoding returns None without an error message,
+        so the next encoding can be tried quietly.
+        """
         try:
-            if not data:
+            records = self._iter_csv_records(file_path, encoding)
+            first = next(records, None)
+            if first is None:
+                print("ERROR: No data found in CSV file")
                 return None
-                
-            cleaned_data = []
+            
+            first_row = dict(first)
             validation_errors = []
+            cleaned_data, total_rows = self._clean_records(chain([first], records),
+                                                           validation_errors)
+            self._report_loaded(total_rows, first_row)
             
-            for i, row in enumerate(data, 1):
-                cleaned_row = {}
-                row_errors = []
-                
-                for key, value in row.items():
-                    # Clean the key (remove whitespace, normalize)
-                    if key is None:
-                        continue  # Skip rows with None keys
-                    clean_key = str(key).strip().lower().replace(' ', '_')
-                    
-                    # Clean the value
-                    if value is None or value == '':
-                        cleaned_value = None
-                    else:
-                        cleaned_value = str(value).strip()
-                        if cleaned_value.lower() in ['na', 'n/a', 'null', 'none']:
-                            cleaned_value = None
-                    
-                    cleaned_row[clean_key] = cleaned_value
-                
-                # Basic validation
-                if self._validate_row(cleaned_row, i):
-                    cleaned_data.append(cleaned_row)
-                else:
-                    validation_errors.append(f"Row {i}: Invalid data")
+        except UnicodeDecodeError:
+            return None
+        except Exception as e:
+            print(f"ERROR: Error reading CSV with {encoding} encoding: {str(e)}")
+            return None
+        
+        self._report_validation(total_rows, len(cleaned_data), validation_errors)
+        return cleaned_data
+    
+    def _iter_csv_records(self, file_path: str, encoding: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the rows of a CSV file as dictionaries keyed by the header.
+        
+        The file is decoded and split into rows as it is read, so only the
+        rows the caller has not consumed yet are held in memory. Large files
+        parsed across worker processes are the exception: their rows come
+        back from the workers, and are held, all at once.
+        """
+        with open(file_path, 'rb') as file:
+            # Detect delimiter (4096 bytes always cover the first
+            # 1024 characters, even for 4-byte UTF-8 sequences)
+            sample = file.read(4096).decode(encoding, errors='replace')[:1024]
+            detected_delimiter = self._detect_delimiter(sample)
+            file.seek(0)
             
-            # Report validation results
-            total_rows = len(data)
-            valid_rows = len(cleaned_data)
-            invalid_rows = total_rows - valid_rows
+            # The supported encodings are all ASCII-compatible, so quotes and
+            # NULs can be looked for in the raw bytes. A file that cannot be
+            # mapped is read through csv.reader, which handles either
+            mapped = self._map_file(file)
+            try:
+                if mapped is None:
+                    quoted, workers = True, 1
+                else:
+                    quoted = mapped.find(b'"') != -1 or mapped.find(b'\0') != -1
+                    workers = self._parallel_workers(mapped)
+                if workers > 1:
+                    rows = self._parallel_parse(file_path, mapped, detected_delimiter,
+                                                encoding, workers)
+            finally:
+                if mapped is not None:
+                    mapped.close()
             
-            print(f"INFO: Data validation results:")
-            print(f"   Total rows: {total_rows}")
-            print(f"   Valid rows: {valid_rows}")
-            print(f"   Invalid rows: {invalid_rows}")
+            if workers > 1:
+                yield from self._records_from_reader(rows)
+                return
             
-            if invalid_rows > 0:
-                print(f"WARNING: {invalid_rows} rows had validation issues")
+            with io.TextIOWrapper(file, encoding=encoding,
+                                  newline='' if quoted else None) as text_file:
+                if quoted:
+                    rows = csv.reader(text_file, delimiter=detected_delimiter)
+                else:
+                    rows = _split_lines(text_file, detected_delimiter)
+                yield from self._records_from_reader(rows)
+    
+    def _report_loaded(self, total_rows: int, first_row: Dict[str, Any]):
+        """Print the row count and columns of a freshly read file."""
+        print(f"SUCCESS: Loaded {total_rows} rows with {len(first_row)} columns")
+        print(f"INFO: Columns: {', '.join(first_row.keys())}")
+    
+    def _detect_delimiter(self, sample: str) -> str:
+        """
+        Detect the field delimiter from a sample of the file.
+        
+        Uses csv.Sniffer restricted to the supported delimiters, which weighs
+        how consistently each candidate splits the sampled lines. If sniffing
+        fails, the candidate occurring most often in the header line wins,
+        defaulting to a comma.
+        """
+        # Only sniff complete lines so a truncated last line does not skew it
+        last_newline = sample.rfind('\n')
+        if last_newline > 0:
+            sample = sample[:last_newline]
+        
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=self.delimiters).delimiter
+        except csv.Error:
+            pass
+        
+        lines = sample.splitlines()
+        counts = Counter(lines[0] if lines else '')
+        best = max(self.delimiters, key=lambda delimiter: counts[delimiter])
+        return best if counts[best] else ','
+    
+    def _map_file(self, file) -> Optional[mmap.mmap]:
+        """
+        Map an open binary file read-only, hinting sequential access.
+        
+        Returns None when the file cannot be mapped (e.g. empty files), in
+        which case callers fall back to a plain read.
+        """
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return None
+        
+        if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return mapped
+    
+    def _parallel_workers(self, raw) -> int:
+        """
+        Decide how many worker processes to parse the file with.
+        
+        Only large files are split, and only when they contain no quote
+        characters: a quoted field may span lines, so newline-aligned chunks
+        are only safe when no quoting is present. The parsed rows are pickled
+        back and unpickled here at about 60% of the cost of parsing them, so
+        splitting only pays off with at least parallel_min_workers CPUs
+        available to this process.
+        """
+        if len(raw) <= self.parallel_threshold or raw.find(b'"') != -1:
+            return 1
+        workers = min(available_cpus(), self.max_workers)
+        return workers if workers >= self.parallel_min_workers else 1
+    
+    def _parallel_parse(self, file_path: str, raw, delimiter: str, encoding: str,
+                        n_workers: int):
+        """
+        Parse the file in newline-aligned byte ranges across worker processes.
+        
+        Each worker maps the file itself, so only (start, end) offsets are sent
+        to it. Returns an iterator over the parsed rows in file order, header
+        first.
+        """
+        size = len(raw)
+        bounds = [0]
+        for i in range(1, n_workers):
+            offset = max(size * i // n_workers, bounds[-1])
+            newline = raw.find(b'\n', offset)
+            if newline == -1:
+                break
+            bounds.append(newline + 1)
+        bounds.append(size)
+        
+        ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(_parse_byte_range, file_path, start, end,
+                                       encoding, delimiter)
+                       for start, end in ranges]
+            chunks = [future.result() for future in futures]
+        
+        return chain.from_iterable(chunks)
+    
+    def _records_from_reader(self, reader) -> Iterator[Dict[str, Any]]:
+        """
+        Yield row dictionaries from a csv.reader.
+        
+        Mirrors csv.DictReader semantics (first row is the header, blank lines
+        are skipped, short rows are padded with None and surplus fields are
+        collected under the None key) while zipping each row straight into a
+        dict instead of going through DictReader's per-row bookkeeping.
+        """
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        width = len(header)
+        if not width:
+            # With an empty header every row is a surplus row (blank lines
+            # are still skipped)
+            for row in reader:
+                if row:
+                    yield {None: row}
+            return
+        
+        for row in reader:
+            count = len(row)
+            if count == width:
+                yield dict(zip(header, row))
+            elif count == 0:
+                continue
+            elif count < width:
+                record = dict(zip(header, row))
+                for key in header[count:]:
+                    record[key] = None
+                yield record
+            else:
+                record = dict(zip(header, row))
+                record[None] = row[width:]
+                yield record
+    
+    def _clean_and_validate_data(self, data: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Clean and validate the loaded data."""
+        try:
+            if not data:
+                return None
             
-            if valid_rows == 0:
-                print("ERROR: No valid data found")
+            validation_errors = []
+            cleaned_data, total_rows = self._clean_records(data, validation_errors)
+            if not self._report_validation(total_rows, len(cleaned_data), validation_errors):
                 return None
                 
             return cleaned_data
@@ -181,36 +420,256 @@ class DataLoader:
             print(f"ERROR: Error cleaning data: {str(e)}")
             return None
     
-    def _validate_row(self, row: Dict[str, Any], row_num: int) -> bool:
-        """Validate a single row of data."""
-        try:
-            # Check for minimum required fields
-            if len(row) < 2:
-                return False
-                
-            # Validate age if present
-            if 'age' in row and row['age'] is not None:
-                try:
-                    age = int(row['age'])
-                    if age < 0 or age > 120:
-                        return False
-                except (ValueError, TypeError):
-                    return False
+    def _clean_records(self, records: Iterable[Dict[str, Any]],
+                       validation_errors: Optional[List[str]] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Clean and validate rows chunk by chunk.
+        
+        Only chunk_size raw rows are held at once, which keeps the columnar
+        cleaning working on bounded lists when fed from a streaming reader.
+        
+        Args:
+            records: Iterable of raw row dictionaries
+            validation_errors: Optional list collecting a message per invalid
+                row; only filled in verbose mode
+            
+        Returns:
+            Tuple of (valid cleaned rows, total rows seen)
+        """
+        records = iter(records)
+        cleaned_data = []
+        total_rows = 0
+        key_map = {}
+        if not self.verbose:
+            validation_errors = None
+        
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                break
             
-            # Validate gender if present
-            if 'gender' in row and row['gender'] is not None:
-                try:
-                    gender = str(row['gender']).lower()
-                    valid_genders = ['male', 'female', 'm', 'f', 'other', 'prefer not to say']
-                    if gender not in valid_genders:
-                        return False
-                except (AttributeError, TypeError):
+            if self._has_uniform_layout(chunk):
+                cleaned_data.extend(self._clean_columns(chunk, validation_errors, total_rows + 1))
+            else:
+                for i, row in enumerate(chunk, total_rows + 1):
+                    cleaned_row = self._clean_row(row, key_map)
+                    if self._validate_row(cleaned_row, i):
+                        cleaned_data.append(cleaned_row)
+                    elif validation_errors is not None:
+                        validation_errors.append(f"Row {i}: Invalid data")
+            total_rows += len(chunk)
+        
+        return cleaned_data, total_rows
+    
+    def _report_validation(self, total_rows: int, valid_rows: int,
+                           validation_errors: Optional[List[str]] = None) -> bool:
+        """Print the validation results; returns False if no rows were valid."""
+        invalid_rows = total_rows - valid_rows
+        
+        print(f"INFO: Data validation results:")
+        print(f"   Total rows: {total_rows}")
+        print(f"   Valid rows: {valid_rows}")
+        print(f"   Invalid rows: {invalid_rows}")
+        
+        if invalid_rows > 0:
+            print(f"WARNING: {invalid_rows} rows had validation issues")
+            
+        # Per-row details are only shown in verbose mode, written in one go
+        if self.verbose and validation_errors:
+            sys.stdout.write('\n'.join(validation_errors) + '\n')
+        
+        if valid_rows == 0:
+            print("ERROR: No valid data found")
+            return False
+            
+        return True
+    
+    def _has_uniform_layout(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        Check whether every row has the first row's columns.
+        
+        Rows may additionally carry surplus fields under the None key (as
+        produced for over-long CSV lines), since those are dropped anyway.
+        """
+        header = {key for key in data[0] if key is not None}
+        width = len(header)
+        for row in data:
+            size = len(row)
+            if size == width:
+                if row.keys() != header:
                     return False
+            elif size != width + 1 or None not in row or not (row.keys() >= header):
+                return False
+        return True
+    
+    def _clean_columns(self, data: List[Dict[str, Any]],
+                       validation_errors: Optional[List[str]] = None,
+                       first_row_num: int = 1) -> List[Dict[str, Any]]:
+        """
+        Clean and validate rows that share one layout, a column at a time.
+        
+        Each column is cleaned in a single pass and validated with the column's
+        own predicate; the per-row validity masks are combined and the rows are
+        rebuilt once from the surviving positions. Invalid rows are recorded in
+        validation_errors when given, numbered from first_row_num.
+        """
+        columns = {}
+        for key in data[0]:
+            if key is None:
+                continue  # Skip surplus fields
+            clean_key = self._clean_key(key)
+            columns[clean_key] = self._clean_values([row[key] for row in data])
+        
+        valid = [len(columns) >= 2] * len(data)
+        for field, predicate in (('gender', self._is_valid_gender), ('age', self._is_valid_age)):
+            if field in columns:
+                # Run the predicate once per distinct value
+                column = columns[field]
+                verdicts = {value: predicate(value) for value in set(column) if value is not None}
+                if all(verdicts.values()):
+                    continue  # Every answer passes, the mask is unchanged
+                verdicts[None] = True
+                valid = list(map(and_, valid, map(verdicts.__getitem__, column)))
+        
+        if validation_errors is not None:
+            validation_errors.extend(f"Row {i}: Invalid data"
+                                     for i, ok in enumerate(valid, first_row_num) if not ok)
+        
+        keys = list(columns)
+        return [dict(zip(keys, values))
+                for values in compress(zip(*columns.values()), valid)]
+    
+    def _clean_key(self, key: Any) -> str:
+        """Normalize a column name (remove whitespace, lowercase, underscores)."""
+        if key.__class__ is not str:
+            key = str(key)
+        return sys.intern(key.strip().lower().replace(' ', '_'))
+    
+    def _clean_values(self, values: List[Any]) -> List[Optional[str]]:
+        """Strip values and map empty and NA markers to None."""
+        # With few distinct strings, clean each once; raw values that clean to
+        # the same answer (e.g. 'Yes' and 'Yes ') share one string object
+        try:
+            distinct = set(values)
+        except TypeError:
+            distinct = ()
+        if len(distinct) * 2 <= len(values) and all(
+                value is None or value.__class__ is str for value in distinct):
+            answers = {}
+            mapping = {}
+            for value in distinct:
+                answer = self._clean_value(value)
+                mapping[value] = answers.setdefault(answer, answer)
+            return list(map(mapping.__getitem__, values))
+        
+        na_values = self.na_values
+        na_length = self.na_length
+        cleaned = []
+        append = cleaned.append
+        for value in values:
+            if value is None or value == '':
+                append(None)
+                continue
             
-            return True
+            # Parsed CSV fields are already str; only convert anything else
+            value = value.strip() if value.__class__ is str else str(value).strip()
+            # Only values as short as an NA marker need the lowercase copy
+            if len(value) <= na_length and value.lower() in na_values:
+                append(None)
+            else:
+                append(value)
+        return cleaned
+    
+    def _clean_value(self, value: Any) -> Optional[str]:
+        """Strip a single value and map empty and NA markers to None."""
+        if value is None or value == '':
+            return None
+        value = value.strip() if value.__class__ is str else str(value).strip()
+        if len(value) <= self.na_length and value.lower() in self.na_values:
+            return None
+        return value
+    
+    def _clean_row(self, row: Dict[str, Any], key_map: Dict[Any, str]) -> Dict[str, Any]:
+        """Clean the keys and values of a single row, caching cleaned keys in key_map."""
+        cleaned_row = {}
+        for key, value in row.items():
+            if key is None:
+                continue  # Skip surplus fields
+            clean_key = key_map.get(key)
+            if clean_key is None:
+                clean_key = key_map[key] = self._clean_key(key)
+            cleaned_row[clean_key] = self._clean_value(value)
+        return cleaned_row
+    
+    def _is_valid_age(self, value: Any) -> bool:
+        """Check that an age value is an integer between 0 and 120."""
+        # Short plain and signed digit strings are checked without exception handling
+        if isinstance(value, str) and len(value) <= 4:
+            if value.isdecimal():
+                return int(value) <= 120
+            if value[:1] in ('+', '-') and value[1:].isdecimal():
+                return 0 <= int(value) <= 120
+        
+        # Anything else int() may still accept (e.g. '2_5' or numbers)
+        try:
+            age = int(value)
+        except (ValueError, TypeError):
+            return False
+        return 0 <= age <= 120
+    
+    def _is_valid_gender(self, value: Any) -> bool:
+        """Check that a gender value is one of the accepted answers."""
+        if value.__class__ is not str:
+            value = str(value)
+        return value.lower() in self.valid_genders
+    
+    def _validate_row(self, row: Dict[str, Any], row_num: int) -> bool:
+        """Validate a single row of data."""
+        # Check for minimum required fields
+        if len(row) < 2:
+            return False
+        
+        # Validate gender if present (cheap set lookup first)
+        gender = row.get('gender')
+        if gender is not None and not self._is_valid_gender(gender):
+            return False
             
-        except Exception:
+        # Validate age if present
+        age = row.get('age')
+        if age is not None and not self._is_valid_age(age):
             return False
+        
+        return True
+    
+    def _detect_column_types(self, data: SurveyFrame):
+        """
+        Classify the columns of freshly loaded data once, so analyses can
+        reuse the result instead of rescanning the rows.
+        
+        A column is free text if any of the first 10 rows holds a string
+        longer than 20 characters, and numeric if more than half of its
+        non-blank values parse as numbers.
+        """
+        for column in data[0].keys():
+            values = data.columns[column]
+            
+            if any(isinstance(value, str) and len(value) > 20 for value in values[:10]):
+                self.text_columns.append(column)
+            
+            # Parse each distinct answer once, weighted by how often it occurs
+            numeric_count = 0
+            total_count = 0
+            for value, count in Counter(values).items():
+                if value is not None and str(value).strip():
+                    total_count += count
+                    try:
+                        float(str(value))
+                        numeric_count += count
+                    except (ValueError, TypeError):
+                        pass
+            
+            if total_count > 0 and (numeric_count / total_count) > 0.5:
+                self.numeric_columns.append(column)
     
     def get_data_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate a summary of the loaded data."""
@@ -226,15 +685,16 @@ class DataLoader:
         
         # Analyze missing values and unique values
         for column in summary['columns']:
-            values = [row.get(column) for row in data]
-            missing_count = sum(1 for v in values if v is None or v == '')
+            # One C-level counting pass yields both the missing and the
+            # distinct counts
+            counts = Counter([row.get(column) for row in data])
+            missing_count = counts[None] + counts['']
             summary['missing_values'][column] = {
                 'count': missing_count,
                 'percentage': (missing_count / len(data)) * 100
             }
             
-            unique_vals = set(v for v in values if v is not None and v != '')
-            summary['unique_values'][column] = len(unique_vals)
+            summary['unique_values'][column] = len(counts) - (None in counts) - ('' in counts)
         
         return summary
     
@@ -289,15 +749,24 @@ class DataLoader:
         ]
         
         try:
+            # The schema is fixed, so render the whole file and write it once
+            fieldnames = list(sample_data[0].keys())
+            lines = [','.join(fieldnames)]
+            for row in sample_data:
+                lines.append(','.join(self._format_csv_field(row[name]) for name in fieldnames))
+            
             with open(file_path, 'w', newline='', encoding='utf-8') as file:
-                if sample_data:
-                    writer = csv.DictWriter(file, fieldnames=sample_data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(sample_data)
+                file.write('\r\n'.join(lines) + '\r\n')
                     
             print(f"SUCCESS: Sample data exported to {file_path}")
             return True
             
         except Exception as e:
             print(f"ERROR: Error exporting sample data: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+    
+    def _format_csv_field(self, value: str) -> str:
+        """Quote a field the way csv.writer does with QUOTE_MINIMAL."""
+        if any(char in value for char in ',"\r\n'):
+            return '"' + value.replace('"', '""') + '"'
+        return value
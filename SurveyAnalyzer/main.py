@@ -65,7 +65,7 @@ class SurveyAnalyzerCLI:
             
         try:
             print_header("Survey Summary Statistics")
-            self.survey_summary = SurveySummary(self.survey_data)
+            self._ensure_survey_summary()
             summary = self.survey_summary.generate_summary()
             
             print("\nRESPONSE OVERVIEW:")
@@ -92,12 +92,8 @@ class SurveyAnalyzerCLI:
             print_header("Sentiment Analysis")
             self.sentiment_analyzer = SentimentAnalyzer()
             
-            # Find text columns
-            text_columns = []
-            for col in self.survey_data[0].keys():
-                if any(isinstance(row[col], str) and len(str(row[col])) > 20 
-                      for row in self.survey_data[:10]):
-                    text_columns.append(col)
+            # Text columns are detected once when the data is loaded
+            text_columns = self.data_loader.text_columns
             
             if not text_columns:
                 print("ERROR: No text columns found for sentiment analysis.")
@@ -141,7 +137,7 @@ class SurveyAnalyzerCLI:
                 return
                 
             crosstab = self.stats_analyzer.cross_tabulate(col1, col2)
-            chi_square = self.stats_analyzer.chi_square_test(col1, col2)
+            chi_square = self.stats_analyzer.chi_square_test(col1, col2, crosstab)
             
             print(f"\nCROSS-TABULATION: {col1} vs {col2}")
             print("=" * 50)
@@ -167,7 +163,7 @@ class SurveyAnalyzerCLI:
             
         try:
             print_header("Pattern Detection")
-            self.pattern_detector = PatternDetector(self.survey_data)
+            self._ensure_pattern_detector()
             
             patterns = self.pattern_detector.find_patterns()
             
@@ -182,6 +178,18 @@ class SurveyAnalyzerCLI:
         except Exception as e:
             print(f"ERROR: Error detecting patterns: {str(e)}")
     
+    def _ensure_survey_summary(self):
+        """Create the survey summary unless one exists for the loaded data."""
+        # Reusing the summary keeps its cached tables across menu actions
+        if self.survey_summary is None or self.survey_summary.survey_data is not self.survey_data:
+            self.survey_summary = SurveySummary(self.survey_data)
+    
+    def _ensure_pattern_detector(self):
+        """Create the pattern detector unless one exists for the loaded data."""
+        # Reusing the detector keeps its cached patterns across menu actions
+        if self.pattern_detector is None or self.pattern_detector.survey_data is not self.survey_data:
+            self.pattern_detector = PatternDetector(self.survey_data)
+    
     def generate_report(self):
         """Generate a comprehensive analysis report."""
         if not self.survey_data:
@@ -192,10 +200,10 @@ class SurveyAnalyzerCLI:
             print_header("Generate Report")
             
             # Initialize all analyzers
-            self.survey_summary = SurveySummary(self.survey_data)
+            self._ensure_survey_summary()
             self.stats_analyzer = StatsAnalyzer(self.survey_data)
             self.sentiment_analyzer = SentimentAnalyzer()
-            self.pattern_detector = PatternDetector(self.survey_data)
+            self._ensure_pattern_detector()
             self.report_generator = ReportGenerator()
             
             output_file = input("Enter output file name (default: survey_report.txt): ").strip()
@@ -6,24 +6,154 @@ using statistical analysis and pattern recognition techniques.
 """
 
 import math
-from typing import List, Dict, Any, Optional, Tuple
+import operator
+import re
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 from collections import defaultdict, Counter
 import itertools
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+from itertools import repeat
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+from utils import available_cpus, get_column
+
+
+def _count_bits(mask: int) -> int:
+    """Count the set bits of a mask."""
+    return bin(mask).count('1')
+
+
+def _relate_masks(masks1: Dict[str, Any], masks2: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Count the related responses of two columns from their response masks.
+    
+    Rows are related when both responses share a sentiment or match exactly
+    (simplified correlation), counted with one bitwise pass over whole columns.
+    
+    Returns:
+        Number of rows answering both columns and number of related rows
+    """
+    answered = masks1['present'] & masks2['present']
+    exact = int.from_bytes(bytes(map(operator.eq, masks1['lowered'], masks2['lowered'])), 'little')
+    related = ((masks1['positive'] & masks2['positive'])
+               | (masks1['negative'] & masks2['negative'])
+               | (exact & answered))
+    return _count_bits(answered), _count_bits(related)
+
+
+def _relate_column_pairs(masks: Dict[str, Dict[str, Any]],
+                         pairs: List[Tuple[str, str]]) -> List[Tuple[int, int]]:
+    """Count the related responses of several column pairs (worker process)."""
+    return [_relate_masks(masks[col1], masks[col2]) for col1, col2 in pairs]
+
+
+class Pattern(Mapping):
+    """
+    A detected pattern.
+    
+    Used while detecting and ranking patterns. It reads like a pattern
+    dictionary (pattern['confidence'], pattern.get('type'), ...) and iterates
+    its keys in the same order, but keeps the fields every pattern has in
+    slots, with only the type-specific extras (e.g. 'response', 'outliers')
+    in a dictionary. Patterns are read-only once detected; the public methods
+    hand callers plain dictionaries made with as_dict().
+    """
+    
+    __slots__ = ('type', 'description', 'confidence', 'sample_size', 'extras')
+    
+    _fields = ('type', 'description', 'confidence', 'sample_size')
+    
+    def __init__(self, type: str, description: str, confidence: float, sample_size: int, **extras):
+        """
+        Initialize a pattern.
+        
+        Args:
+            type: Pattern type, e.g. 'age_pattern'
+            description: Human-readable description of the pattern
+            confidence: Confidence level in percent
+            sample_size: Number of responses the pattern is based on
+            **extras: Type-specific details of the pattern
+        """
+        self.type = type
+        self.description = description
+        self.confidence = confidence
+        self.sample_size = sample_size
+        self.extras = extras
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        return self.extras[key]
+    
+    def __iter__(self):
+        yield from self._fields
+        yield from self.extras
+    
+    def __len__(self) -> int:
+        return len(self._fields) + len(self.extras)
+    
+    def __repr__(self) -> str:
+        return f"Pattern({self.as_dict()!r})"
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the pattern as a new dictionary, with its keys in order and nested values copied."""
+        pattern = {'type': self.type, 'description': self.description,
+                   'confidence': self.confidence, 'sample_size': self.sample_size}
+        pattern.update(copy.deepcopy(self.extras))
+        return pattern
 
 
 class PatternDetector:
     """Handles pattern detection and correlation analysis in survey data."""
     
-    def __init__(self, survey_data: List[Dict[str, Any]]):
+    def __init__(self, survey_data: Iterable[Dict[str, Any]]):
         """
         Initialize the pattern detector.
         
         Args:
-            survey_data: List of dictionaries containing survey responses
+            survey_data: List of dictionaries containing survey responses, or
+                any iterable of them (e.g. rows streamed from a file)
         """
+        # Rows are read chunk by chunk when they are not already in a list
+        self.chunk_size = 65536
+        
         self.survey_data = survey_data
-        self.total_responses = len(survey_data)
-        self.columns = list(survey_data[0].keys()) if survey_data else []
+        if isinstance(survey_data, list):
+            self.total_responses = len(survey_data)
+            self.columns = list(survey_data[0].keys()) if survey_data else []
+            
+            # Column-oriented view of the responses (one list per column), read
+            # by every analysis instead of looking values up row by row
+            self._values = {column: get_column(survey_data, column) for column in self.columns}
+        else:
+            self._values = self._read_columns(survey_data)
+            self.columns = list(self._values)
+            self.total_responses = len(self._values[self.columns[0]]) if self.columns else 0
+        
+        # Sentiment words used to relate responses, matched as substrings by
+        # one precompiled alternation each
+        self.positive_words = ['good', 'great', 'excellent', 'satisfied', 'happy', 'like', 'love']
+        self.negative_words = ['bad', 'poor', 'terrible', 'dissatisfied', 'unhappy', 'dislike', 'hate']
+        self._positive_re = re.compile('|'.join(map(re.escape, self.positive_words)))
+        self._negative_re = re.compile('|'.join(map(re.escape, self.negative_words)))
+        self._stripped = {}
+        self._features = {}
+        
+        # Correlation pairs are scored across worker processes once pairs times
+        # rows exceeds this
+        self.parallel_threshold = 4000000
+        self.max_workers = 8
+        
+        # Lowest age of each age group after the first (18-25)
+        self.age_bounds = [26, 36, 46, 56, 66]
+        
+        # Structures shared by all analyses, built once by _prepare()
+        self._prepared = False
+        self._groups = {}
+        self._counts = {}
+        self._patterns_cache = None
         
     def find_patterns(self) -> List[Dict[str, Any]]:
         """
@@ -32,10 +162,20 @@ class PatternDetector:
         Returns:
             List of detected patterns with descriptions and confidence levels
         """
-        if not self.survey_data:
+        return [pattern.as_dict() for pattern in self._detect_patterns()]
+    
+    def _detect_patterns(self) -> List[Pattern]:
+        """Detect all patterns, sorted by descending confidence."""
+        if not self.total_responses:
             return []
         
+        # The survey data is fixed for a detector, so the patterns are only
+        # detected once
+        if self._patterns_cache is not None:
+            return self._patterns_cache
+        
         patterns = []
+        self._prepare()
         
         # Find demographic patterns
         patterns.extend(self._find_demographic_patterns())
@@ -50,11 +190,113 @@ class PatternDetector:
         patterns.extend(self._find_outlier_patterns())
         
         # Sort patterns by confidence
-        patterns.sort(key=lambda x: x['confidence'], reverse=True)
+        patterns.sort(key=attrgetter('confidence'), reverse=True)
         
+        self._patterns_cache = patterns
         return patterns
     
-    def _find_demographic_patterns(self) -> List[Dict[str, Any]]:
+    def _read_columns(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Read streamed rows into one list per column, a chunk at a time.
+        
+        Only the current chunk of row dictionaries is held while its values
+        are appended to the columns, so the full list of rows never exists
+        next to the columns. As for a list of rows, the columns are those of
+        the first row.
+        
+        Args:
+            rows: Iterable of dictionaries containing survey responses
+            
+        Returns:
+            Column name to list of values (None where a row lacks the column)
+        """
+        rows = iter(rows)
+        columns = None
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            if columns is None:
+                columns = {column: [] for column in chunk[0]}
+            for column, values in columns.items():
+                values.extend([row.get(column) for row in chunk])
+        return columns or {}
+    
+    def _prepare(self):
+        """
+        Build the structures every analysis reads, in one go.
+        
+        Rows are grouped once per demographic column, the non-empty responses
+        to each question are counted once and each question's response masks
+        are built once, so the demographic, correlation, combination and
+        outlier analyses share them instead of rescanning the columns.
+        """
+        if self._prepared:
+            return
+        
+        if 'age' in self._values:
+            self._groups['age'] = self._group_by_age()
+        for column in ('gender', 'region', 'education'):
+            if column in self._values:
+                self._groups[column] = self._group_by_title(column)
+        
+        for column in self.columns:
+            if column not in ['age', 'gender', 'region', 'education']:
+                self._counts[column] = self._count_responses(self._values[column])
+                self._response_masks(column)
+        
+        self._prepared = True
+    
+    def _group_by_age(self) -> Dict[str, List[int]]:
+        """Group row positions into age groups."""
+        age_groups = {
+            '18-25': [],
+            '26-35': [],
+            '36-45': [],
+            '46-55': [],
+            '56-65': [],
+            '65+': []
+        }
+        
+        # Each distinct age is bucketed once, by bisecting the group bounds
+        labels = list(age_groups)
+        buckets = {}
+        for age_str in set(self._values['age']):
+            bucket = None
+            if age_str and str(age_str).isdigit():
+                try:
+                    age = int(age_str)
+                    if age >= 18:
+                        bucket = age_groups[labels[bisect_right(self.age_bounds, age)]]
+                except ValueError:
+                    pass
+            buckets[age_str] = bucket
+        
+        for index, age_str in enumerate(self._values['age']):
+            bucket = buckets[age_str]
+            if bucket is not None:
+                bucket.append(index)
+        
+        return age_groups
+    
+    def _group_by_title(self, column: str) -> Dict[str, List[int]]:
+        """Group row positions by the title-cased value of a column."""
+        groups = defaultdict(list)
+        
+        # Each distinct value is labelled once; rows labelled alike share the
+        # group's index list, so grouping is one lookup and append per row
+        positions = {}
+        for value in self._values[column]:
+            if value not in positions and value and str(value).strip():
+                positions[value] = groups[str(value).strip().title()]
+        
+        for index, value in enumerate(self._values[column]):
+            group = positions.get(value)
+            if group is not None:
+                group.append(index)
+        return groups
+    
+    def _find_demographic_patterns(self) -> List[Pattern]:
         """Find patterns related to demographics."""
         patterns = []
         
@@ -80,65 +322,28 @@ class PatternDetector:
         
         return patterns
     
-    def _analyze_age_patterns(self) -> List[Dict[str, Any]]:
+    def _analyze_age_patterns(self) -> List[Pattern]:
         """Analyze patterns based on age groups."""
         patterns = []
         
-        # Group responses by age
-        age_groups = {
-            '18-25': [],
-            '26-35': [],
-            '36-45': [],
-            '46-55': [],
-            '56-65': [],
-            '65+': []
-        }
-        
-        for row in self.survey_data:
-            age_str = row.get('age')
-            if age_str and str(age_str).isdigit():
-                try:
-                    age = int(age_str)
-                    if 18 <= age <= 25:
-                        age_groups['18-25'].append(row)
-                    elif 26 <= age <= 35:
-                        age_groups['26-35'].append(row)
-                    elif 36 <= age <= 45:
-                        age_groups['36-45'].append(row)
-                    elif 46 <= age <= 55:
-                        age_groups['46-55'].append(row)
-                    elif 56 <= age <= 65:
-                        age_groups['56-65'].append(row)
-                    elif age > 65:
-                        age_groups['65+'].append(row)
-                except ValueError:
-                    continue
+        # Responses grouped by age
+        self._prepare()
+        age_groups = self._groups['age']
         
         # Analyze patterns for each question
         for column in self.columns:
-            if column not in ['age', 'gender', 'region', 'education']:
+            if column not in ['age', 'gender', 'region', 'education'] and self._has_repeated_response(column):
                 column_patterns = self._analyze_column_by_age_groups(column, age_groups)
                 patterns.extend(column_patterns)
         
         return patterns
     
-    def _analyze_column_by_age_groups(self, column: str, age_groups: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _analyze_column_by_age_groups(self, column: str, age_groups: Dict[str, List[int]]) -> List[Pattern]:
         """Analyze a specific column's responses by age groups."""
         patterns = []
         
         # Get most common response for each age group
-        age_group_responses = {}
-        for age_group, responses in age_groups.items():
-            if responses:
-                values = [r.get(column) for r in responses if r.get(column)]
-                if values:
-                    value_counts = Counter(values)
-                    most_common = value_counts.most_common(1)[0]
-                    age_group_responses[age_group] = {
-                        'response': most_common[0],
-                        'count': most_common[1],
-                        'percentage': (most_common[1] / len(values)) * 100
-                    }
+        age_group_responses = self._mode_by_group(column, age_groups)
         
         # Find patterns
         if len(age_group_responses) > 1:
@@ -150,53 +355,105 @@ class PatternDetector:
             for response, age_groups_list in response_groups.items():
                 if len(age_groups_list) > 1:
                     confidence = min(90, len(age_groups_list) * 20)
-                    patterns.append({
-                        'type': 'age_pattern',
-                        'description': f"Age groups {', '.join(age_groups_list)} most commonly responded '{response}' to {column}",
-                        'confidence': confidence,
-                        'sample_size': sum(len(age_groups[ag]) for ag in age_groups_list),
-                        'response': response,
-                        'affected_groups': age_groups_list
-                    })
+                    patterns.append(Pattern(
+                        type='age_pattern',
+                        description=f"Age groups {', '.join(age_groups_list)} most commonly responded '{response}' to {column}",
+                        confidence=confidence,
+                        sample_size=sum(len(age_groups[ag]) for ag in age_groups_list),
+                        response=response,
+                        affected_groups=age_groups_list
+                    ))
         
         return patterns
     
-    def _analyze_gender_patterns(self) -> List[Dict[str, Any]]:
+    def _mode_by_group(self, column: str, groups: Dict[str, List[int]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Find the most common response to a column within each group.
+        
+        Args:
+            column: Column whose responses are compared
+            groups: Group label to the row positions in that group
+            
+        Returns:
+            Group label to its most common response, with the response's count
+            and its percentage of the group's non-empty responses. Groups
+            without any responses to the column are left out.
+        """
+        column_values = self._values[column]
+        modes = {}
+        
+        for group, indices in groups.items():
+            counts = self._count_responses(map(column_values.__getitem__, indices))
+            if counts:
+                # max keeps the first-seen of tied responses, as most_common does
+                response, count = max(counts.items(), key=itemgetter(1))
+                modes[group] = {
+                    'response': response,
+                    'count': count,
+                    'percentage': (count / sum(counts.values())) * 100
+                }
+        
+        return modes
+    
+    def _has_repeated_response(self, column: str) -> bool:
+        """
+        Check whether any non-empty response to a question occurs twice.
+        
+        Age, regional and education patterns need two groups sharing a most
+        common response, which is impossible when every response is unique.
+        """
+        counts = self._counts[column]
+        return len(counts) < sum(counts.values())
+    
+    def _has_varied_responses(self, column: str) -> bool:
+        """
+        Check whether a question has at least two different non-empty responses.
+        
+        Gender patterns need groups with different most common responses.
+        """
+        return len(self._counts[column]) >= 2
+    
+    def _count_responses(self, values) -> Counter:
+        """
+        Count the non-empty responses among the given values.
+        
+        Every value is counted in a single Counter pass and the empty ones are
+        dropped afterwards, which keeps the first-seen order of the remaining
+        responses (and so how most_common breaks ties).
+        
+        Args:
+            values: Iterable of response values
+            
+        Returns:
+            Counter of the non-empty responses
+        """
+        counts = Counter(values)
+        for empty in [value for value in counts if not value]:
+            del counts[empty]
+        return counts
+    
+    def _analyze_gender_patterns(self) -> List[Pattern]:
         """Analyze patterns based on gender."""
         patterns = []
         
-        # Group responses by gender
-        gender_groups = defaultdict(list)
-        for row in self.survey_data:
-            gender = row.get('gender')
-            if gender and str(gender).strip():
-                gender_groups[str(gender).strip().title()].append(row)
+        # Responses grouped by gender
+        self._prepare()
+        gender_groups = self._groups['gender']
         
         # Analyze patterns for each question
         for column in self.columns:
-            if column not in ['age', 'gender', 'region', 'education']:
+            if column not in ['age', 'gender', 'region', 'education'] and self._has_varied_responses(column):
                 column_patterns = self._analyze_column_by_gender(column, gender_groups)
                 patterns.extend(column_patterns)
         
         return patterns
     
-    def _analyze_column_by_gender(self, column: str, gender_groups: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _analyze_column_by_gender(self, column: str, gender_groups: Dict[str, List[int]]) -> List[Pattern]:
         """Analyze a specific column's responses by gender."""
         patterns = []
         
         # Get most common response for each gender
-        gender_responses = {}
-        for gender, responses in gender_groups.items():
-            if responses:
-                values = [r.get(column) for r in responses if r.get(column)]
-                if values:
-                    value_counts = Counter(values)
-                    most_common = value_counts.most_common(1)[0]
-                    gender_responses[gender] = {
-                        'response': most_common[0],
-                        'count': most_common[1],
-                        'percentage': (most_common[1] / len(values)) * 100
-                    }
+        gender_responses = self._mode_by_group(column, gender_groups)
         
         # Find gender differences
         if len(gender_responses) > 1:
@@ -204,52 +461,38 @@ class PatternDetector:
             if len(set(r['response'] for r in responses)) > 1:
                 # Different genders have different most common responses
                 confidence = 75
-                patterns.append({
-                    'type': 'gender_pattern',
-                    'description': f"Gender differences detected in {column} responses",
-                    'confidence': confidence,
-                    'sample_size': sum(len(gender_groups[g]) for g in gender_responses.keys()),
-                    'details': gender_responses
-                })
+                patterns.append(Pattern(
+                    type='gender_pattern',
+                    description=f"Gender differences detected in {column} responses",
+                    confidence=confidence,
+                    sample_size=sum(len(gender_groups[g]) for g in gender_responses.keys()),
+                    details=gender_responses
+                ))
         
         return patterns
     
-    def _analyze_regional_patterns(self) -> List[Dict[str, Any]]:
+    def _analyze_regional_patterns(self) -> List[Pattern]:
         """Analyze patterns based on region."""
         patterns = []
         
-        # Group responses by region
-        regional_groups = defaultdict(list)
-        for row in self.survey_data:
-            region = row.get('region')
-            if region and str(region).strip():
-                regional_groups[str(region).strip().title()].append(row)
+        # Responses grouped by region
+        self._prepare()
+        regional_groups = self._groups['region']
         
         # Analyze patterns for each question
         for column in self.columns:
-            if column not in ['age', 'gender', 'region', 'education']:
+            if column not in ['age', 'gender', 'region', 'education'] and self._has_repeated_response(column):
                 column_patterns = self._analyze_column_by_region(column, regional_groups)
                 patterns.extend(column_patterns)
         
         return patterns
     
-    def _analyze_column_by_region(self, column: str, regional_groups: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _analyze_column_by_region(self, column: str, regional_groups: Dict[str, List[int]]) -> List[Pattern]:
         """Analyze a specific column's responses by region."""
         patterns = []
         
         # Get most common response for each region
-        regional_responses = {}
-        for region, responses in regional_groups.items():
-            if responses:
-                values = [r.get(column) for r in responses if r.get(column)]
-                if values:
-                    value_counts = Counter(values)
-                    most_common = value_counts.most_common(1)[0]
-                    regional_responses[region] = {
-                        'response': most_common[0],
-                        'count': most_common[1],
-                        'percentage': (most_common[1] / len(values)) * 100
-                    }
+        regional_responses = self._mode_by_group(column, regional_groups)
         
         # Find regional patterns
         if len(regional_responses) > 1:
@@ -261,53 +504,39 @@ class PatternDetector:
             for response, regions_list in response_groups.items():
                 if len(regions_list) > 1:
                     confidence = min(85, len(regions_list) * 25)
-                    patterns.append({
-                        'type': 'regional_pattern',
-                        'description': f"Regions {', '.join(regions_list)} most commonly responded '{response}' to {column}",
-                        'confidence': confidence,
-                        'sample_size': sum(len(regional_groups[r]) for r in regions_list),
-                        'response': response,
-                        'affected_regions': regions_list
-                    })
+                    patterns.append(Pattern(
+                        type='regional_pattern',
+                        description=f"Regions {', '.join(regions_list)} most commonly responded '{response}' to {column}",
+                        confidence=confidence,
+                        sample_size=sum(len(regional_groups[r]) for r in regions_list),
+                        response=response,
+                        affected_regions=regions_list
+                    ))
         
         return patterns
     
-    def _analyze_education_patterns(self) -> List[Dict[str, Any]]:
+    def _analyze_education_patterns(self) -> List[Pattern]:
         """Analyze patterns based on education level."""
         patterns = []
         
-        # Group responses by education
-        education_groups = defaultdict(list)
-        for row in self.survey_data:
-            education = row.get('education')
-            if education and str(education).strip():
-                education_groups[str(education).strip().title()].append(row)
+        # Responses grouped by education
+        self._prepare()
+        education_groups = self._groups['education']
         
         # Analyze patterns for each question
         for column in self.columns:
-            if column not in ['age', 'gender', 'region', 'education']:
+            if column not in ['age', 'gender', 'region', 'education'] and self._has_repeated_response(column):
                 column_patterns = self._analyze_column_by_education(column, education_groups)
                 patterns.extend(column_patterns)
         
         return patterns
     
-    def _analyze_column_by_education(self, column: str, education_groups: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _analyze_column_by_education(self, column: str, education_groups: Dict[str, List[int]]) -> List[Pattern]:
         """Analyze a specific column's responses by education level."""
         patterns = []
         
         # Get most common response for each education level
-        education_responses = {}
-        for education, responses in education_groups.items():
-            if responses:
-                values = [r.get(column) for r in responses if r.get(column)]
-                if values:
-                    value_counts = Counter(values)
-                    most_common = value_counts.most_common(1)[0]
-                    education_responses[education] = {
-                        'response': most_common[0],
-                        'count': most_common[1],
-                        'percentage': (most_common[1] / len(values)) * 100
-                    }
+        education_responses = self._mode_by_group(column, education_groups)
         
         # Find education-based patterns
         if len(education_responses) > 1:
@@ -319,99 +548,145 @@ class PatternDetector:
             for response, education_levels in response_groups.items():
                 if len(education_levels) > 1:
                     confidence = min(80, len(education_levels) * 20)
-                    patterns.append({
-                        'type': 'education_pattern',
-                        'description': f"Education levels {', '.join(education_levels)} most commonly responded '{response}' to {column}",
-                        'confidence': confidence,
-                        'sample_size': sum(len(education_groups[e]) for e in education_levels),
-                        'response': response,
-                        'affected_education_levels': education_levels
-                    })
+                    patterns.append(Pattern(
+                        type='education_pattern',
+                        description=f"Education levels {', '.join(education_levels)} most commonly responded '{response}' to {column}",
+                        confidence=confidence,
+                        sample_size=sum(len(education_groups[e]) for e in education_levels),
+                        response=response,
+                        affected_education_levels=education_levels
+                    ))
         
         return patterns
     
-    def _find_correlation_patterns(self) -> List[Dict[str, Any]]:
+    def _find_correlation_patterns(self) -> List[Pattern]:
         """Find correlation patterns between different questions."""
         patterns = []
         
-        # Analyze correlations between categorical variables
+        # Analyze correlations between categorical variables; both columns of
+        # a pair need at least two different responses
         categorical_columns = [col for col in self.columns if col not in ['age', 'gender', 'region', 'education']]
-        
-        for i, col1 in enumerate(categorical_columns):
-            for col2 in categorical_columns[i+1:]:
-                correlation_pattern = self._analyze_correlation(col1, col2)
-                if correlation_pattern:
-                    patterns.append(correlation_pattern)
+        pairs = [(col1, col2)
+                 for i, col1 in enumerate(categorical_columns)
+                 for col2 in categorical_columns[i+1:]
+                 if self._response_masks(col1)['unique'] >= 2 and self._response_masks(col2)['unique'] >= 2]
+        
+        workers = self._parallel_workers(len(pairs))
+        if workers > 1:
+            counts = self._parallel_relate(pairs, workers)
+        else:
+            counts = [_relate_masks(self._response_masks(col1), self._response_masks(col2))
+                      for col1, col2 in pairs]
+        
+        for (col1, col2), (total_responses, matching_responses) in zip(pairs, counts):
+            correlation_pattern = self._correlation_pattern(col1, col2, total_responses, matching_responses)
+            if correlation_pattern:
+                patterns.append(correlation_pattern)
         
         return patterns
     
-    def _analyze_correlation(self, col1: str, col2: str) -> Optional[Dict[str, Any]]:
-        """Analyze correlation between two columns."""
-        # Get unique values for both columns
-        values1 = set()
-        values2 = set()
+    def _parallel_workers(self, n_pairs: int) -> int:
+        """Decide how many worker processes to score the column pairs with."""
+        if n_pairs < 2 or n_pairs * self.total_responses <= self.parallel_threshold:
+            return 1
+        return min(available_cpus(), self.max_workers, n_pairs)
+    
+    def _parallel_relate(self, pairs: List[Tuple[str, str]], n_workers: int) -> List[Tuple[int, int]]:
+        """
+        Score column pairs in contiguous slices across worker processes.
         
-        for row in self.survey_data:
-            val1 = row.get(col1)
-            val2 = row.get(col2)
-            
-            if val1 is not None and str(val1).strip():
-                values1.add(str(val1).strip())
-            if val2 is not None and str(val2).strip():
-                values2.add(str(val2).strip())
+        Each worker is only sent the masks of the columns in its slice.
+        Returns the counts in the order of the pairs.
+        """
+        size = -(-len(pairs) // n_workers)
+        slices = [pairs[start:start + size] for start in range(0, len(pairs), size)]
+        with ProcessPoolExecutor(max_workers=len(slices)) as executor:
+            futures = []
+            for chunk in slices:
+                columns = {column for pair in chunk for column in pair}
+                masks = {column: self._response_masks(column) for column in columns}
+                futures.append(executor.submit(_relate_column_pairs, masks, chunk))
+            return [counts for future in futures for counts in future.result()]
+    
+    def _analyze_correlation(self, col1: str, col2: str) -> Optional[Pattern]:
+        """Analyze correlation between two columns."""
+        masks1 = self._response_masks(col1)
+        masks2 = self._response_masks(col2)
         
-        if len(values1) < 2 or len(values2) < 2:
+        # Both columns need at least two different responses
+        if masks1['unique'] < 2 or masks2['unique'] < 2:
             return None
         
-        # Calculate correlation strength
-        total_responses = 0
-        matching_responses = 0
-        
-        for row in self.survey_data:
-            val1 = row.get(col1)
-            val2 = row.get(col2)
-            
-            if val1 is not None and str(val1).strip() and val2 is not None and str(val2).strip():
-                total_responses += 1
-                # Check if responses are related (simplified correlation)
-                if self._are_responses_related(str(val1).strip(), str(val2).strip()):
-                    matching_responses += 1
-        
+        total_responses, matching_responses = _relate_masks(masks1, masks2)
+        return self._correlation_pattern(col1, col2, total_responses, matching_responses)
+    
+    def _correlation_pattern(self, col1: str, col2: str, total_responses: int,
+                             matching_responses: int) -> Optional[Pattern]:
+        """Build the correlation pattern of two columns from their related response counts."""
         if total_responses == 0:
             return None
         
         correlation_strength = matching_responses / total_responses
         
         if correlation_strength > 0.6:  # Strong correlation threshold
-            return {
-                'type': 'correlation_pattern',
-                'description': f"Strong correlation detected between {col1} and {col2}",
-                'confidence': min(90, correlation_strength * 100),
-                'sample_size': total_responses,
-                'correlation_strength': correlation_strength,
-                'columns': [col1, col2]
-            }
+            return Pattern(
+                type='correlation_pattern',
+                description=f"Strong correlation detected between {col1} and {col2}",
+                confidence=min(90, correlation_strength * 100),
+                sample_size=total_responses,
+                correlation_strength=correlation_strength,
+                columns=[col1, col2]
+            )
         
         return None
     
+    def _response_masks(self, column: str) -> Dict[str, Any]:
+        """
+        Get the relatedness masks of a column's responses.
+        
+        Row i of the column is byte i of each mask (either 0 or 1), so masks of
+        two columns combine with plain integer & and |, and a set bit count
+        gives the number of matching rows. The masks record which rows have a
+        response ('present') and which contain a positive or negative word;
+        'lowered' holds the lowercased responses (None when empty) and
+        'unique' the number of distinct responses. Responses are classified
+        once per distinct value and the masks are cached per column.
+        """
+        masks = self._features.get(column)
+        if masks is None:
+            stripped = self._stripped_values(column)
+            distinct = {None: (False, False, None)}
+            for response in set(stripped):
+                if response is not None:
+                    distinct[response] = self._classify_response(response)
+            features = list(map(distinct.__getitem__, stripped))
+            
+            lowered = list(map(itemgetter(2), features))
+            masks = {
+                'present': int.from_bytes(bytes(map(operator.is_not, lowered, repeat(None))), 'little'),
+                'positive': int.from_bytes(bytes(map(itemgetter(0), features)), 'little'),
+                'negative': int.from_bytes(bytes(map(itemgetter(1), features)), 'little'),
+                'lowered': lowered,
+                'unique': len(distinct) - 1
+            }
+            self._features[column] = masks
+        return masks
+    
+    def _classify_response(self, response: str) -> Tuple[bool, bool, str]:
+        """Return (has positive word, has negative word, lowercased response)."""
+        response_lower = response.lower()
+        return (self._positive_re.search(response_lower) is not None,
+                self._negative_re.search(response_lower) is not None,
+                response_lower)
+    
     def _are_responses_related(self, response1: str, response2: str) -> bool:
         """Check if two responses are related (simplified logic)."""
         # This is a simplified correlation check
         # In a real implementation, you might use more sophisticated methods
-        
-        # Check for similar sentiment
-        positive_words = ['good', 'great', 'excellent', 'satisfied', 'happy', 'like', 'love']
-        negative_words = ['bad', 'poor', 'terrible', 'dissatisfied', 'unhappy', 'dislike', 'hate']
-        
-        response1_lower = response1.lower()
-        response2_lower = response2.lower()
+        response1_positive, response1_negative, response1_lower = self._classify_response(response1)
+        response2_positive, response2_negative, response2_lower = self._classify_response(response2)
         
         # Check if both responses have similar sentiment
-        response1_positive = any(word in response1_lower for word in positive_words)
-        response1_negative = any(word in response1_lower for word in negative_words)
-        response2_positive = any(word in response2_lower for word in positive_words)
-        response2_negative = any(word in response2_lower for word in negative_words)
-        
         if response1_positive and response2_positive:
             return True
         if response1_negative and response2_negative:
@@ -423,41 +698,70 @@ class PatternDetector:
         
         return False
     
-    def _find_combination_patterns(self) -> List[Dict[str, Any]]:
+    def _find_combination_patterns(self) -> List[Pattern]:
         """Find patterns in response combinations."""
         patterns = []
         
-        # Find common response combinations
-        response_combinations = []
-        for row in self.survey_data:
-            combination = []
-            for col in self.columns:
-                value = row.get(col)
-                if value is not None and str(value).strip():
-                    combination.append(f"{col}:{str(value).strip()}")
-            if combination:
-                response_combinations.append(tuple(sorted(combination)))
-        
-        # Count combinations
-        combination_counts = Counter(response_combinations)
-        common_combinations = combination_counts.most_common(3)
+        # Find common response combinations: with the column order fixed, a
+        # row's combination is identified by its tuple of stripped responses
+        # (None where empty), so rows are counted without formatting or
+        # sorting anything
+        empty = (None,) * len(self.columns)
+        combination_counts = Counter(zip(*(self._stripped_values(col) for col in self.columns)))
+        combination_counts.pop(empty, None)
+        total_combinations = sum(combination_counts.values())
+        common_combinations = [
+            (tuple(sorted(f"{col}:{value}" for col, value in zip(self.columns, signature) if value is not None)), count)
+            for signature, count in combination_counts.most_common(3)
+        ]
         
         for combo, count in common_combinations:
             if count > 1:  # Only report if combination appears more than once
-                percentage = (count / len(response_combinations)) * 100
+                percentage = (count / total_combinations) * 100
                 if percentage > 10:  # Only report if more than 10% of responses
-                    patterns.append({
-                        'type': 'combination_pattern',
-                        'description': f"Common response combination: {', '.join(combo)}",
-                        'confidence': min(85, percentage * 2),
-                        'sample_size': count,
-                        'percentage': percentage,
-                        'combination': list(combo)
-                    })
+                    patterns.append(Pattern(
+                        type='combination_pattern',
+                        description=f"Common response combination: {', '.join(combo)}",
+                        confidence=min(85, percentage * 2),
+                        sample_size=count,
+                        percentage=percentage,
+                        combination=list(combo)
+                    ))
         
         return patterns
     
-    def _find_outlier_patterns(self) -> List[Dict[str, Any]]:
+    def _stripped_values(self, column: str) -> List[Optional[str]]:
+        """
+        Get a column's responses stripped of surrounding whitespace.
+        
+        Empty responses become None. When every response is a str (or None)
+        each distinct value is stripped once, values stripping to the same
+        response share one string, and the column is cached for the other
+        analyses. Other columns are stripped value by value: equal numbers
+        such as 1, 1.0 and True would share one distinct entry but not one
+        string form, and unhashable values have no distinct entry at all.
+        """
+        values = self._stripped.get(column)
+        if values is None:
+            column_values = self._values[column]
+            try:
+                distinct = set(column_values)
+            except TypeError:
+                distinct = None
+            if distinct is not None and all(value is None or value.__class__ is str for value in distinct):
+                responses = {}
+                stripped = {}
+                for value in distinct:
+                    response = value.strip() if value is not None else ''
+                    stripped[value] = responses.setdefault(response, response) if response else None
+                values = list(map(stripped.__getitem__, column_values))
+            else:
+                values = [(str(value).strip() or None) if value is not None else None
+                          for value in column_values]
+            self._stripped[column] = values
+        return values
+    
+    def _find_outlier_patterns(self) -> List[Pattern]:
         """Find outlier patterns in responses."""
         patterns = []
         
@@ -470,17 +774,16 @@ class PatternDetector:
         
         return patterns
     
-    def _analyze_outliers(self, column: str) -> Optional[Dict[str, Any]]:
+    def _analyze_outliers(self, column: str) -> Optional[Pattern]:
         """Analyze outliers in a specific column."""
-        values = [row.get(column) for row in self.survey_data if row.get(column)]
+        # Count responses
+        self._prepare()
+        value_counts = self._counts[column]
+        total_responses = sum(value_counts.values())
         
-        if not values:
+        if not total_responses:
             return None
         
-        # Count responses
-        value_counts = Counter(values)
-        total_responses = len(values)
-        
         # Find responses that appear very rarely (outliers)
         outlier_threshold = total_responses * 0.05  # 5% threshold
         
@@ -494,26 +797,33 @@ class PatternDetector:
                 })
         
         if outliers:
-            return {
-                'type': 'outlier_pattern',
-                'description': f"Outlier responses detected in {column}",
-                'confidence': 70,
-                'sample_size': total_responses,
-                'outliers': outliers
-            }
+            return Pattern(
+                type='outlier_pattern',
+                description=f"Outlier responses detected in {column}",
+                confidence=70,
+                sample_size=total_responses,
+                outliers=outliers
+            )
         
         return None
     
     def get_pattern_summary(self) -> Dict[str, Any]:
         """Generate a summary of detected patterns."""
-        patterns = self.find_patterns()
+        patterns = self._detect_patterns()
+        
+        # Patterns come sorted by descending confidence, so each confidence
+        # band is a slice of the list, found by bisecting the negated
+        # confidences
+        confidences = [-pattern.confidence for pattern in patterns]
+        high_end = bisect_right(confidences, -80)
+        medium_end = bisect_right(confidences, -60)
         
         summary = {
             'total_patterns': len(patterns),
-            'pattern_types': Counter(p['type'] for p in patterns),
-            'high_confidence_patterns': [p for p in patterns if p['confidence'] >= 80],
-            'medium_confidence_patterns': [p for p in patterns if 60 <= p['confidence'] < 80],
-            'low_confidence_patterns': [p for p in patterns if p['confidence'] < 60]
+            'pattern_types': Counter(map(attrgetter('type'), patterns)),
+            'high_confidence_patterns': [pattern.as_dict() for pattern in patterns[:high_end]],
+            'medium_confidence_patterns': [pattern.as_dict() for pattern in patterns[high_end:medium_end]],
+            'low_confidence_patterns': [pattern.as_dict() for pattern in patterns[medium_end:]]
         }
         
         return summary 
\ No newline at end of file
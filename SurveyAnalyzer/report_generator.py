@@ -5,25 +5,117 @@ Description: Generates comprehensive analysis reports from survey data
 and saves them to text files with proper formatting and structure.
 """
 
+import io
 import os
+import stat
+import tempfile
+from collections import defaultdict
+from bisect import bisect_right
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, TextIO, Tuple, Union
+
+# Rules and static text blocks of the report, built once per import
+_RULE = "=" * 80
+_SECTION_RULE = "-" * 50
+_SUMMARY_RULE = "=" * 50
+
+# Average completeness needed for each data quality rating after "Poor"
+_QUALITY_THRESHOLDS = (70, 80, 90)
+_QUALITY_RATINGS = ("Poor", "Fair", "Good", "Excellent")
+
+_HEADER_BLURB = (
+    "This report provides a comprehensive analysis of survey responses including\n"
+    "demographic breakdowns, sentiment analysis, pattern detection, and\n"
+    "statistical insights to support data-driven decision making.\n"
+)
+
+_KEY_HIGHLIGHTS = (
+    "Key Highlights:\n"
+    "- Comprehensive analysis of survey data across multiple dimensions\n"
+    "- Demographic breakdowns reveal respondent characteristics\n"
+    "- Sentiment analysis provides insights into respondent attitudes\n"
+    "- Pattern detection identifies correlations and trends\n"
+    "- Statistical analysis supports evidence-based conclusions\n"
+)
+
+# Closes the recommendations section, blank line included
+_GENERAL_RECOMMENDATIONS = (
+    "- Consider conducting follow-up surveys to validate findings\n"
+    "- Implement targeted improvements based on demographic insights\n"
+    "- Monitor sentiment trends over time for continuous improvement\n"
+    "- Use statistical insights to inform decision-making processes\n"
+    "\n"
+)
+
+_SUMMARY_KEY_METRICS = (
+    "Key Metrics:\n"
+    "- Data quality assessment\n"
+    "- Demographic breakdowns\n"
+    "- Response distributions\n"
+    "- Pattern detection results\n"
+)
+
+_FOOTER_BLURB = (
+    "This report was generated automatically by the Survey Data Analyzer.\n"
+    "For questions or additional analysis, please contact the development team.\n"
+)
+
+# Fetches every figure a column's sentiment results are reported with, in
+# one call
+_sentiment_fields = itemgetter('total_responses', 'positive', 'positive_pct', 'negative',
+                               'negative_pct', 'neutral', 'neutral_pct', 'avg_score')
+
+@lru_cache(maxsize=4096)
+def _format_percentage(count: int, total: int) -> str:
+    """Format count as a percentage of total, to one decimal place."""
+    return f"{(count / total) * 100:.1f}"
+
+
+def _open_temp_report(directory: str) -> Tuple[str, TextIO]:
+    """
+    Create and open a new temporary report file in directory.
+    
+    The file is created with the permissions open() would give a new file,
+    under the current umask, and a 64KB write buffer.
+    
+    Returns:
+        Tuple of the file's path and the open file
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    for _ in range(tempfile.TMP_MAX):
+        temp_path = os.path.join(directory, f".report-{os.urandom(6).hex()}.tmp")
+        try:
+            fd = os.open(temp_path, flags, 0o666)
+        except FileExistsError:
+            continue
+        return temp_path, io.open(fd, 'w', encoding='utf-8', buffering=1 << 16)
+    raise FileExistsError("No usable temporary report file name")
 
 
 class ReportGenerator:
     """Handles generation of comprehensive survey analysis reports."""
     
+    __slots__ = ('current_datetime', '_formatted_datetime', '_datetime_strings')
+    
     def __init__(self):
         """Initialize the report generator."""
-        self.report_sections = []
         self.current_datetime = datetime.now()
         
+        # Formatted forms of current_datetime, and the datetime they were
+        # formatted from
+        self._formatted_datetime = None
+        self._datetime_strings = {}
+        
     def generate_report(self, report_data: Dict[str, Any]) -> bool:
         """
         Generate a comprehensive survey analysis report.
         
         Args:
-            report_data: Dictionary containing all analysis results
+            report_data: Dictionary containing all analysis results, and
+                either an open text 'file' to write the report to or the
+                'file_path' to save it at
             
         Returns:
             True if report was generated successfully, False otherwise
@@ -33,13 +125,10 @@ class ReportGenerator:
             summary = report_data.get('summary', {})
             sentiment = report_data.get('sentiment', {})
             patterns = report_data.get('patterns', [])
-            file_path = report_data.get('file_path', 'survey_report.txt')
+            target = report_data.get('file') or report_data.get('file_path', 'survey_report.txt')
             
-            # Build report content
-            report_content = self._build_report_content(summary, sentiment, patterns)
-            
-            # Write report to file
-            success = self._write_report_to_file(report_content, file_path)
+            # Write the report to file section by section
+            success = self._stream_report_to_file(target, summary, sentiment, patterns)
             
             return success
             
@@ -49,246 +138,267 @@ class ReportGenerator:
     
     def _build_report_content(self, summary: Dict[str, Any], sentiment: Dict[str, Any], patterns: List[Dict[str, Any]]) -> str:
         """Build the complete report content."""
-        report_lines = []
+        buf = io.StringIO()
+        self._write_report(buf, summary, sentiment, patterns)
+        return buf.getvalue()
+    
+    def _write_report(self, buf: TextIO, summary: Dict[str, Any], sentiment: Dict[str, Any], patterns: List[Dict[str, Any]]):
+        """
+        Write the complete report content.
+        
+        Every section writes its lines straight into the given text stream,
+        a StringIO buffer or an open report file.
+        """
+        # Facts shared by the sentiment, pattern, key findings and
+        # recommendations sections, from one pass over the sentiment results
+        # and patterns
+        precomputed = self._precompute_findings(sentiment, patterns)
         
         # Header
-        report_lines.extend(self._generate_header())
+        self._generate_header(buf)
         
         # Executive Summary
-        report_lines.extend(self._generate_executive_summary(summary))
+        self._generate_executive_summary(buf, summary)
         
         # Survey Overview
-        report_lines.extend(self._generate_survey_overview(summary))
+        self._generate_survey_overview(buf, summary)
         
         # Demographic Analysis
-        report_lines.extend(self._generate_demographic_analysis(summary))
+        self._generate_demographic_analysis(buf, summary)
         
         # Sentiment Analysis
-        report_lines.extend(self._generate_sentiment_analysis(sentiment))
+        self._generate_sentiment_analysis(buf, sentiment, precomputed)
         
         # Pattern Analysis
-        report_lines.extend(self._generate_pattern_analysis(patterns))
+        self._generate_pattern_analysis(buf, patterns, precomputed)
         
         # Statistical Analysis
-        report_lines.extend(self._generate_statistical_analysis(summary))
+        self._generate_statistical_analysis(buf, summary)
         
         # Key Findings
-        report_lines.extend(self._generate_key_findings(summary, sentiment, patterns))
+        self._generate_key_findings(buf, summary, precomputed)
         
         # Recommendations
-        report_lines.extend(self._generate_recommendations(summary, sentiment, patterns))
+        self._generate_recommendations(buf, summary, precomputed)
         
         # Footer
-        report_lines.extend(self._generate_footer())
+        self._generate_footer(buf)
+    
+    def _get_datetime_strings(self) -> Dict[str, str]:
+        """
+        Get current_datetime formatted for the report.
+        
+        The strings are formatted once and reused for as long as
+        current_datetime stays the same.
         
-        return "\n".join(report_lines)
+        Returns:
+            Dictionary with the 'pretty' date and time, the 'report_id' and
+            the plain 'date'
+        """
+        if self._formatted_datetime != self.current_datetime:
+            moment = self.current_datetime
+            self._datetime_strings = {
+                'pretty': moment.strftime('%B %d, %Y at %I:%M %p'),
+                'report_id': f"SUR-{moment.strftime('%Y%m%d-%H%M%S')}",
+                'date': moment.strftime('%B %d, %Y')
+            }
+            self._formatted_datetime = moment
+        return self._datetime_strings
     
-    def _generate_header(self) -> List[str]:
+    def _write_section_title(self, buf: TextIO, title: str):
+        """Write a section title followed by its underline and a blank line."""
+        buf.write(f"{title}\n{_SECTION_RULE}\n\n")
+    
+    def _generate_header(self, buf: TextIO):
         """Generate the report header."""
-        header = [
-            "=" * 80,
-            "SURVEY DATA ANALYSIS REPORT",
-            "=" * 80,
-            f"Generated on: {self.current_datetime.strftime('%B %d, %Y at %I:%M %p')}",
-            f"Report ID: SUR-{self.current_datetime.strftime('%Y%m%d-%H%M%S')}",
-            "",
-            "This report provides a comprehensive analysis of survey responses including",
-            "demographic breakdowns, sentiment analysis, pattern detection, and",
-            "statistical insights to support data-driven decision making.",
-            "",
-            "=" * 80,
-            ""
-        ]
-        return header
+        datetime_strings = self._get_datetime_strings()
+        buf.write(
+            f"{_RULE}\n"
+            "SURVEY DATA ANALYSIS REPORT\n"
+            f"{_RULE}\n"
+            f"Generated on: {datetime_strings['pretty']}\n"
+            f"Report ID: {datetime_strings['report_id']}\n"
+            "\n"
+            f"{_HEADER_BLURB}"
+            "\n"
+            f"{_RULE}\n"
+            "\n"
+        )
     
-    def _generate_executive_summary(self, summary: Dict[str, Any]) -> List[str]:
+    def _generate_executive_summary(self, buf: TextIO, summary: Dict[str, Any]):
         """Generate the executive summary section."""
-        lines = [
-            "EXECUTIVE SUMMARY",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "EXECUTIVE SUMMARY")
         
         if summary:
             total_responses = summary.get('total_responses', 0)
             response_rate = summary.get('response_rate', 0)
             
-            lines.extend([
-                            f"Total Survey Responses: {total_responses:,}",
-            f"Response Rate: {response_rate:.1f}%",
-                "",
-                "Key Highlights:",
-                            "- Comprehensive analysis of survey data across multiple dimensions",
-            "- Demographic breakdowns reveal respondent characteristics",
-            "- Sentiment analysis provides insights into respondent attitudes",
-            "- Pattern detection identifies correlations and trends",
-            "- Statistical analysis supports evidence-based conclusions",
-                ""
-            ])
-        
-        return lines
+            buf.write(
+                f"Total Survey Responses: {total_responses:,}\n"
+                f"Response Rate: {response_rate:.1f}%\n"
+                "\n"
+                f"{_KEY_HIGHLIGHTS}"
+                "\n"
+            )
     
-    def _generate_survey_overview(self, summary: Dict[str, Any]) -> List[str]:
+    def _generate_survey_overview(self, buf: TextIO, summary: Dict[str, Any]):
         """Generate the survey overview section."""
-        lines = [
-            "SURVEY OVERVIEW",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "SURVEY OVERVIEW")
         
         if summary:
             total_responses = summary.get('total_responses', 0)
             data_quality = summary.get('data_quality', {})
             
-            lines.extend([
-                f"Survey Details:",
-                f"   - Total Responses: {total_responses:,}",
-                f"   - Data Quality: {self._assess_data_quality(data_quality)}",
-                ""
-            ])
+            buf.write(
+                "Survey Details:\n"
+                f"   - Total Responses: {total_responses:,}\n"
+                f"   - Data Quality: {self._assess_data_quality(data_quality)}\n"
+                "\n"
+            )
             
             # Data quality metrics
             if data_quality:
                 completeness = data_quality.get('completeness', {})
                 if completeness:
-                    lines.append("Data Completeness by Column:")
-                    for column, completeness_pct in completeness.items():
-                        lines.append(f"   - {column}: {completeness_pct:.1f}%")
-                    lines.append("")
-        
-        return lines
+                    buf.write("Data Completeness by Column:\n")
+                    buf.write(''.join([f"   - {column}: {completeness_pct:.1f}%\n"
+                                       for column, completeness_pct in completeness.items()]))
+                    buf.write("\n")
     
-    def _generate_demographic_analysis(self, summary: Dict[str, Any]) -> List[str]:
+    def _generate_demographic_analysis(self, buf: TextIO, summary: Dict[str, Any]):
         """Generate the demographic analysis section."""
-        lines = [
-            "DEMOGRAPHIC ANALYSIS",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "DEMOGRAPHIC ANALYSIS")
         
         demographics = summary.get('demographics', {})
         
         if demographics:
-            lines.append("👥 Respondent Demographics:")
-            lines.append("")
+            buf.write("👥 Respondent Demographics:\n\n")
             
             for demo_field, breakdown in demographics.items():
                 if breakdown:
-                    lines.append(f"{demo_field.title()}:")
                     total_demo = sum(breakdown.values())
+                    buf.write(f"{demo_field.title()}:\n")
+                    buf.write(''.join([f"   - {category}: {count} ({_format_percentage(count, total_demo)}%)\n"
+                                       for category, count in breakdown.items()]))
                     
-                    for category, count in breakdown.items():
-                        percentage = (count / total_demo) * 100
-                        lines.append(f"   - {category}: {count} ({percentage:.1f}%)")
-                    
-                    lines.append("")
+                    buf.write("\n")
         else:
-            lines.append("No demographic data available for analysis.")
-            lines.append("")
-        
-        return lines
+            buf.write("No demographic data available for analysis.\n\n")
     
-    def _generate_sentiment_analysis(self, sentiment: Dict[str, Any]) -> List[str]:
+    def _generate_sentiment_analysis(self, buf: TextIO, sentiment: Dict[str, Any], precomputed: Dict[str, Any]):
         """Generate the sentiment analysis section."""
-        lines = [
-            "SENTIMENT ANALYSIS",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "SENTIMENT ANALYSIS")
         
         if sentiment:
-            lines.append("💭 Text Response Sentiment Analysis:")
-            lines.append("")
+            buf.write("💭 Text Response Sentiment Analysis:\n\n")
             
-            for column, results in sentiment.items():
-                if isinstance(results, dict) and 'total_responses' in results:
-                    lines.append(f"{column}:")
-                    lines.append(f"   - Total Responses: {results['total_responses']}")
-                    lines.append(f"   - Positive: {results['positive']} ({results['positive_pct']:.1f}%)")
-                    lines.append(f"   - Negative: {results['negative']} ({results['negative_pct']:.1f}%)")
-                    lines.append(f"   - Neutral: {results['neutral']} ({results['neutral_pct']:.1f}%)")
-                    lines.append(f"   - Average Sentiment Score: {results['avg_score']:.2f}")
-                    lines.append("")
+            for column, results in precomputed['sentiment_results']:
+                if 'total_responses' in results:
+                    (total, positive, positive_pct, negative, negative_pct,
+                     neutral, neutral_pct, avg_score) = _sentiment_fields(results)
+                    buf.write(
+                        f"{column}:\n"
+                        f"   - Total Responses: {total}\n"
+                        f"   - Positive: {positive} ({positive_pct:.1f}%)\n"
+                        f"   - Negative: {negative} ({negative_pct:.1f}%)\n"
+                        f"   - Neutral: {neutral} ({neutral_pct:.1f}%)\n"
+                        f"   - Average Sentiment Score: {avg_score:.2f}\n"
+                        "\n"
+                    )
         else:
-            lines.append("No text responses available for sentiment analysis.")
-            lines.append("")
-        
-        return lines
+            buf.write("No text responses available for sentiment analysis.\n\n")
     
-    def _generate_pattern_analysis(self, patterns: List[Dict[str, Any]]) -> List[str]:
+    def _generate_pattern_analysis(self, buf: TextIO, patterns: List[Dict[str, Any]], precomputed: Dict[str, Any]):
         """Generate the pattern analysis section."""
-        lines = [
-            "PATTERN ANALYSIS",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "PATTERN ANALYSIS")
         
         if patterns:
-            lines.append("Detected Patterns and Correlations:")
-            lines.append("")
-            
-            # Group patterns by type
-            pattern_types = {}
-            for pattern in patterns:
-                pattern_type = pattern.get('type', 'unknown')
-                if pattern_type not in pattern_types:
-                    pattern_types[pattern_type] = []
-                pattern_types[pattern_type].append(pattern)
+            buf.write("Detected Patterns and Correlations:\n\n")
             
-            for pattern_type, type_patterns in pattern_types.items():
-                lines.append(f"{pattern_type.replace('_', ' ').title()} Patterns:")
-                for pattern in type_patterns:
-                    lines.append(f"   - {pattern['description']}")
-                    lines.append(f"     Confidence: {pattern['confidence']:.1f}%")
-                    lines.append(f"     Sample Size: {pattern['sample_size']}")
-                    lines.append("")
+            # Patterns grouped by type
+            for pattern_type, type_patterns in precomputed['pattern_types'].items():
+                buf.write(f"{pattern_type.replace('_', ' ').title()} Patterns:\n")
+                buf.write(''.join([
+                    f"   - {pattern['description']}\n"
+                    f"     Confidence: {pattern['confidence']:.1f}%\n"
+                    f"     Sample Size: {pattern['sample_size']}\n"
+                    "\n"
+                    for pattern in type_patterns
+                ]))
         else:
-            lines.append("No significant patterns detected in the survey data.")
-            lines.append("")
-        
-        return lines
+            buf.write("No significant patterns detected in the survey data.\n\n")
     
-    def _generate_statistical_analysis(self, summary: Dict[str, Any]) -> List[str]:
+    def _generate_statistical_analysis(self, buf: TextIO, summary: Dict[str, Any]):
         """Generate the statistical analysis section."""
-        lines = [
-            "STATISTICAL ANALYSIS",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "STATISTICAL ANALYSIS")
         
         question_summaries = summary.get('question_summaries', {})
         
         if question_summaries:
-            lines.append("Response Distribution Analysis:")
-            lines.append("")
+            buf.write("Response Distribution Analysis:\n\n")
             
             for question, q_summary in question_summaries.items():
                 if isinstance(q_summary, dict):
-                    lines.append(f"{question}:")
-                    lines.append(f"   - Total Responses: {q_summary.get('total_responses', 0)}")
-                    lines.append(f"   - Response Rate: {q_summary.get('response_rate', 0):.1f}%")
+                    buf.write(
+                        f"{question}:\n"
+                        f"   - Total Responses: {q_summary.get('total_responses', 0)}\n"
+                        f"   - Response Rate: {q_summary.get('response_rate', 0):.1f}%\n"
+                    )
                     
                     top_responses = q_summary.get('top_responses', [])
                     if top_responses:
-                        lines.append("   - Top Responses:")
-                        for response, count in top_responses[:3]:
-                            percentage = (count / q_summary['total_responses']) * 100
-                            lines.append(f"     - {response}: {count} ({percentage:.1f}%)")
+                        total_responses = q_summary['total_responses']
+                        buf.write("   - Top Responses:\n")
+                        buf.write(''.join([f"     - {response}: {count} ({_format_percentage(count, total_responses)}%)\n"
+                                           for response, count in top_responses[:3]]))
                     
-                    lines.append("")
+                    buf.write("\n")
         else:
-            lines.append("No question response data available for statistical analysis.")
-            lines.append("")
+            buf.write("No question response data available for statistical analysis.\n\n")
+    
+    def _precompute_findings(self, sentiment: Dict[str, Any], patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Derive the sentiment and pattern facts used by several report sections.
+        
+        Checks each sentiment result's type a single time and derives the
+        facts from the validated results, and groups the patterns by type
+        while counting the high-confidence ones, so the sentiment, pattern,
+        key findings and recommendations sections share them instead of each
+        scanning the sentiment results and patterns again.
         
-        return lines
+        Args:
+            sentiment: Sentiment analysis results by column
+            patterns: Detected patterns
+            
+        Returns:
+            Dictionary with the (column, results) pairs whose results are
+            dictionaries, the dominant sentiment of each such column, the
+            columns with high negative sentiment, the patterns grouped by type
+            (in first-seen order) and the number of high-confidence patterns
+        """
+        sentiment_results = [(column, results) for column, results in (sentiment or {}).items()
+                             if isinstance(results, dict)]
+        
+        pattern_types = defaultdict(list)
+        high_confidence_patterns = 0
+        for pattern in patterns or []:
+            pattern_types[pattern.get('type', 'unknown')].append(pattern)
+            if pattern.get('confidence', 0) >= 80:
+                high_confidence_patterns += 1
+        
+        return {
+            'sentiment_results': sentiment_results,
+            'dominant_sentiments': [(column, self._get_dominant_sentiment(results))
+                                    for column, results in sentiment_results],
+            'negative_sentiment_columns': [column for column, results in sentiment_results
+                                           if results.get('negative_pct', 0) > 30],
+            'pattern_types': pattern_types,
+            'high_confidence_patterns': high_confidence_patterns
+        }
     
-    def _generate_key_findings(self, summary: Dict[str, Any], sentiment: Dict[str, Any], patterns: List[Dict[str, Any]]) -> List[str]:
+    def _generate_key_findings(self, buf: TextIO, summary: Dict[str, Any], precomputed: Dict[str, Any]):
         """Generate the key findings section."""
-        lines = [
-            "KEY FINDINGS",
-            "-" * 50,
-            ""
-        ]
+        self._write_section_title(buf, "KEY FINDINGS")
         
         findings = []
         
@@ -297,39 +407,27 @@ class ReportGenerator:
         if demographics:
             for demo_field, breakdown in demographics.items():
                 if breakdown:
-                    most_common = max(breakdown.items(), key=lambda x: x[1])
+                    most_common = max(breakdown.items(), key=itemgetter(1))
                     findings.append(f"- {demo_field.title()}: {most_common[0]} is the most common category ({most_common[1]} responses)")
         
         # Sentiment findings
-        if sentiment:
-            for column, results in sentiment.items():
-                if isinstance(results, dict):
-                    dominant_sentiment = self._get_dominant_sentiment(results)
-                    findings.append(f"- {column}: {dominant_sentiment} sentiment dominates the responses")
+        for column, dominant_sentiment in precomputed['dominant_sentiments']:
+            findings.append(f"- {column}: {dominant_sentiment} sentiment dominates the responses")
         
         # Pattern findings
-        if patterns:
-            high_confidence_patterns = [p for p in patterns if p.get('confidence', 0) >= 80]
-            if high_confidence_patterns:
-                findings.append(f"- {len(high_confidence_patterns)} high-confidence patterns detected in the data")
+        if precomputed['high_confidence_patterns']:
+            findings.append(f"- {precomputed['high_confidence_patterns']} high-confidence patterns detected in the data")
         
         if findings:
-            lines.extend(findings)
+            buf.write(''.join([f"{finding}\n" for finding in findings]))
         else:
-            lines.append("No significant findings to report at this time.")
+            buf.write("No significant findings to report at this time.\n")
         
-        lines.append("")
-        return lines
+        buf.write("\n")
     
-    def _generate_recommendations(self, summary: Dict[str, Any], sentiment: Dict[str, Any], patterns: List[Dict[str, Any]]) -> List[str]:
+    def _generate_recommendations(self, buf: TextIO, summary: Dict[str, Any], precomputed: Dict[str, Any]):
         """Generate the recommendations section."""
-        lines = [
-            "RECOMMENDATIONS",
-            "-" * 50,
-            ""
-        ]
-        
-        recommendations = []
+        self._write_section_title(buf, "RECOMMENDATIONS")
         
         # Data quality recommendations
         data_quality = summary.get('data_quality', {})
@@ -337,51 +435,33 @@ class ReportGenerator:
             completeness = data_quality.get('completeness', {})
             low_completeness = [col for col, comp in completeness.items() if comp < 80]
             if low_completeness:
-                recommendations.append(f"- Improve data collection for columns with low completeness: {', '.join(low_completeness)}")
+                buf.write(f"- Improve data collection for columns with low completeness: {', '.join(low_completeness)}\n")
         
         # Sentiment-based recommendations
-        if sentiment:
-            negative_sentiment_columns = []
-            for column, results in sentiment.items():
-                if isinstance(results, dict) and results.get('negative_pct', 0) > 30:
-                    negative_sentiment_columns.append(column)
-            
-            if negative_sentiment_columns:
-                recommendations.append(f"- Address concerns in columns with high negative sentiment: {', '.join(negative_sentiment_columns)}")
+        negative_sentiment_columns = precomputed['negative_sentiment_columns']
+        if negative_sentiment_columns:
+            buf.write(f"- Address concerns in columns with high negative sentiment: {', '.join(negative_sentiment_columns)}\n")
         
         # Pattern-based recommendations
-        if patterns:
-            high_confidence_patterns = [p for p in patterns if p.get('confidence', 0) >= 80]
-            if high_confidence_patterns:
-                recommendations.append(f"- Investigate {len(high_confidence_patterns)} high-confidence patterns for actionable insights")
+        if precomputed['high_confidence_patterns']:
+            buf.write(f"- Investigate {precomputed['high_confidence_patterns']} high-confidence patterns for actionable insights\n")
         
         # General recommendations
-        recommendations.extend([
-            "- Consider conducting follow-up surveys to validate findings",
-            "- Implement targeted improvements based on demographic insights",
-            "- Monitor sentiment trends over time for continuous improvement",
-            "- Use statistical insights to inform decision-making processes"
-        ])
-        
-        lines.extend(recommendations)
-        lines.append("")
-        
-        return lines
+        buf.write(_GENERAL_RECOMMENDATIONS)
     
-    def _generate_footer(self) -> List[str]:
+    def _generate_footer(self, buf: TextIO):
         """Generate the report footer."""
-        footer = [
-            "=" * 80,
-            "REPORT END",
-            "=" * 80,
-            "",
-            "This report was generated automatically by the Survey Data Analyzer.",
-            "For questions or additional analysis, please contact the development team.",
-            "",
-            f"Report generated on: {self.current_datetime.strftime('%B %d, %Y at %I:%M %p')}",
-            "=" * 80
-        ]
-        return footer
+        # The closing rule ends the report, with no newline after it
+        buf.write(
+            f"{_RULE}\n"
+            "REPORT END\n"
+            f"{_RULE}\n"
+            "\n"
+            f"{_FOOTER_BLURB}"
+            "\n"
+            f"Report generated on: {self._get_datetime_strings()['pretty']}\n"
+            f"{_RULE}"
+        )
     
     def _assess_data_quality(self, data_quality: Dict[str, Any]) -> str:
         """Assess overall data quality."""
@@ -392,19 +472,16 @@ class ReportGenerator:
         if not completeness:
             return "Unknown"
         
+        # len() of a dict is constant time, so this is one pass over the values
         avg_completeness = sum(completeness.values()) / len(completeness)
         
-        if avg_completeness >= 90:
-            return "Excellent"
-        elif avg_completeness >= 80:
-            return "Good"
-        elif avg_completeness >= 70:
-            return "Fair"
-        else:
-            return "Poor"
+        return _QUALITY_RATINGS[bisect_right(_QUALITY_THRESHOLDS, avg_completeness)]
     
     def _get_dominant_sentiment(self, sentiment_results: Dict[str, Any]) -> str:
         """Get the dominant sentiment from results."""
+        # Positive or negative only dominate when strictly ahead of both other
+        # shares; every tie falls back to Neutral. A plain argmax would break
+        # ties by position instead, so the two short comparisons stay
         positive_pct = sentiment_results.get('positive_pct', 0)
         negative_pct = sentiment_results.get('negative_pct', 0)
         neutral_pct = sentiment_results.get('neutral_pct', 0)
@@ -416,13 +493,71 @@ class ReportGenerator:
         else:
             return "Neutral"
     
-    def _write_report_to_file(self, content: str, file_path: str) -> bool:
-        """Write the report content to a file."""
+    def _stream_report_to_file(self, file_path: Union[str, TextIO], summary: Dict[str, Any], sentiment: Dict[str, Any], patterns: List[Dict[str, Any]]) -> bool:
+        """
+        Write the report to a file as its sections are generated.
+        
+        The report never exists as one string; sections go through a 64KB
+        write buffer into a temporary file next to the target, which replaces
+        the target only once the whole report is written, so a failed build
+        leaves any existing report untouched. A symlinked target is resolved
+        first, so the report replaces the file the link points to and the
+        link itself is kept. An existing report keeps its permissions. An
+        already open file-like object is written to directly (and left
+        open). Failing to write prints an error and returns False, as
+        _write_report_to_file does. Any other error while building the
+        report is raised to the caller.
+        """
+        if hasattr(file_path, 'write'):
+            try:
+                self._write_report(file_path, summary, sentiment, patterns)
+                return True
+            except OSError as e:
+                print(f"Error writing report to file: {str(e)}")
+                return False
+        
+        temp_path = None
+        try:
+            target = os.path.realpath(file_path)
+            
+            # Ensure directory exists
+            directory = os.path.dirname(target)
+            os.makedirs(directory, exist_ok=True)
+            
+            temp_path, file = _open_temp_report(directory)
+            with file:
+                self._write_report(file, summary, sentiment, patterns)
+            
+            try:
+                os.chmod(temp_path, stat.S_IMODE(os.stat(target).st_mode))
+            except FileNotFoundError:
+                pass  # A new report keeps the permissions it was created with
+            os.replace(temp_path, target)
+            temp_path = None
+            
+            return True
+            
+        except OSError as e:
+            print(f"Error writing report to file: {str(e)}")
+            return False
+        finally:
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+    
+    def _write_report_to_file(self, content: str, file_path: Union[str, TextIO]) -> bool:
+        """Write the report content to a file path or an open file-like object."""
         try:
+            if hasattr(file_path, 'write'):
+                file_path.write(content)
+                return True
+            
             # Ensure directory exists
             directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             
             # Write content to file
             with open(file_path, 'w', encoding='utf-8') as file:
@@ -437,24 +572,18 @@ class ReportGenerator:
     def generate_summary_report(self, summary_data: Dict[str, Any], file_path: str = "summary_report.txt") -> bool:
         """Generate a simplified summary report."""
         try:
-            lines = [
-                "SURVEY SUMMARY REPORT",
-                "=" * 50,
-                f"Generated: {self.current_datetime.strftime('%B %d, %Y')}",
-                "",
-                f"Total Responses: {summary_data.get('total_responses', 0)}",
-                f"Response Rate: {summary_data.get('response_rate', 0):.1f}%",
-                "",
-                "Key Metrics:",
-                            "- Data quality assessment",
-            "- Demographic breakdowns",
-            "- Response distributions",
-            "- Pattern detection results",
-                "",
-                "=" * 50
-            ]
-            
-            content = "\n".join(lines)
+            content = (
+                "SURVEY SUMMARY REPORT\n"
+                f"{_SUMMARY_RULE}\n"
+                f"Generated: {self._get_datetime_strings()['date']}\n"
+                "\n"
+                f"Total Responses: {summary_data.get('total_responses', 0)}\n"
+                f"Response Rate: {summary_data.get('response_rate', 0):.1f}%\n"
+                "\n"
+                f"{_SUMMARY_KEY_METRICS}"
+                "\n"
+                f"{_SUMMARY_RULE}"
+            )
             return self._write_report_to_file(content, file_path)
             
         except Exception as e:
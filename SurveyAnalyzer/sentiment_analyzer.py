@@ -8,6 +8,53 @@ keyword matching and scoring systems without external libraries.
 import re
 from typing import List, Dict, Any, Optional
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from functools import lru_cache, partial
+from operator import is_not, itemgetter
+from utils import available_cpus, get_column
+
+# Patterns used by _normalize_text, compiled once for the per-response path.
+# Punctuation is replaced by a space, not dropped, so "good,fast" stays two words
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s\']')
+
+# Runs of word characters and apostrophes: exactly the tokens that
+# _extract_words yields from _clean_text output, found in one regex pass.
+# Apostrophes stay inside tokens ("don't", "customers'") as they do there
+_WORD_RE = re.compile(r"[\w']+")
+
+# Field accessors so result aggregation runs through map() instead of
+# one generator expression per statistic
+_get_sentiment = itemgetter('sentiment')
+_get_score = itemgetter('score')
+_get_confidence = itemgetter('confidence')
+_get_positive_words = itemgetter('positive_words')
+_get_negative_words = itemgetter('negative_words')
+
+
+@lru_cache(maxsize=2048)
+def _normalize_text(text: str) -> str:
+    """
+    Lowercase a text, collapse its whitespace and replace punctuation.
+    
+    Cached because feedback columns repeat the same short answers; the result
+    is an immutable string, so cache hits can be shared safely.
+    """
+    text = text.lower()
+    
+    # Remove extra whitespace
+    text = _WHITESPACE_RE.sub(' ', text)
+    
+    # Remove punctuation (keep apostrophes for contractions)
+    text = _PUNCTUATION_RE.sub(' ', text)
+    
+    return text.strip()
+
+
+def _analyze_texts(analyzer: 'SentimentAnalyzer', texts: List[str]) -> List[Dict[str, Any]]:
+    """Score a slice of texts with the given analyzer (worker process)."""
+    return list(map(analyzer.analyze_text, texts))
 
 
 class SentimentAnalyzer:
@@ -64,6 +111,32 @@ class SentimentAnalyzer:
             'highly': 1.5, 'incredibly': 2.0, 'amazingly': 2.0, 'exceptionally': 2.0,
             'particularly': 1.2, 'especially': 1.2, 'notably': 1.2, 'remarkably': 1.5
         }
+        
+        # Single lookup table for the scoring loop
+        self._lexicon = self._build_lexicon()
+        
+        # analyze_column scores distinct texts across worker processes once
+        # their combined length exceeds this many characters
+        self.parallel_threshold = 4000000
+        self.max_workers = 8
+    
+    def _build_lexicon(self) -> Dict[str, int]:
+        """
+        Merge the keyword dictionaries into one token lookup table.
+        
+        Positive keywords map to their weight, negative keywords to the negated
+        weight and intensifiers to 0, so each token costs a single dict probe.
+        Later entries win, matching the intensifier > positive > negative
+        priority of the checks in analyze_text. Negation words are tracked
+        separately and must not appear in the keyword dictionaries.
+        
+        Returns:
+            Dictionary mapping lowercase tokens to signed weights
+        """
+        lexicon = {word: -weight for word, weight in self.negative_keywords.items()}
+        lexicon.update(self.positive_keywords)
+        lexicon.update(dict.fromkeys(self.intensifier_words, 0))
+        return lexicon
     
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
@@ -84,11 +157,23 @@ class SentimentAnalyzer:
                 'confidence': 0.0
             }
         
-        # Clean and normalize text
-        cleaned_text = self._clean_text(text)
+        # Clean, normalize and extract words in a single scan
+        words = _WORD_RE.findall(text.lower())
         
-        # Extract words
-        words = self._extract_words(cleaned_text)
+        lexicon = self._lexicon
+        # Most responses contain no lexicon word at all; the C-level
+        # disjointness check settles those without the per-word loop, as a
+        # zero score with no sentiment words and zero confidence
+        if lexicon.keys().isdisjoint(words):
+            return {
+                'sentiment': self._categorize_sentiment(0),
+                'score': 0,
+                'positive_words': [],
+                'negative_words': [],
+                'confidence': 0.0,
+                'total_words': len(words),
+                'sentiment_words': 0
+            }
         
         # Analyze sentiment
         sentiment_score = 0
@@ -96,36 +181,32 @@ class SentimentAnalyzer:
         negative_words = []
         intensifier_count = 0
         
+        negation_words = self.negation_words
+        # A negation at index j flips keywords j+1..j+3, the same window
+        # _is_negated scans, so remembering where it ends avoids re-scanning
+        negated_until = 0
         for i, word in enumerate(words):
-            word_lower = word.lower()
+            # Words come from the lowercased text, so no further folding is needed
+            weight = lexicon.get(word)
+            if weight is None:
+                if word in negation_words:
+                    negated_until = i + 4
+                continue
             
             # Check for intensifiers
-            if word_lower in self.intensifier_words:
+            if not weight:
                 intensifier_count += 1
                 continue
             
-            # Check for negations
-            is_negated = self._is_negated(words, i)
-            
-            # Check positive keywords
-            if word_lower in self.positive_keywords:
-                weight = self.positive_keywords[word_lower]
-                if is_negated:
-                    sentiment_score -= weight
-                    negative_words.append(word)
-                else:
-                    sentiment_score += weight
-                    positive_words.append(word)
+            # Negation flips the keyword's polarity
+            if i < negated_until:
+                weight = -weight
             
-            # Check negative keywords
-            elif word_lower in self.negative_keywords:
-                weight = self.negative_keywords[word_lower]
-                if is_negated:
-                    sentiment_score += weight
-                    positive_words.append(word)
-                else:
-                    sentiment_score -= weight
-                    negative_words.append(word)
+            sentiment_score += weight
+            if weight > 0:
+                positive_words.append(word)
+            else:
+                negative_words.append(word)
         
         # Apply intensifier multiplier
         if intensifier_count > 0:
@@ -172,15 +253,33 @@ class SentimentAnalyzer:
                 'total_responses': 0
             }
         
-        sentiment_results = []
-        total_responses = 0
+        # Non-blank answers as strings, filtered by C-level iterators rather
+        # than one conversion and strip per row in Python
+        present = filter(partial(is_not, None), get_column(survey_data, column))
+        texts = list(filter(str.strip, map(str, present)))
+        total_responses = len(texts)
+        
+        # Score each distinct text once
+        distinct_texts = list(dict.fromkeys(texts))
+        workers = self._parallel_workers(distinct_texts)
+        if workers > 1:
+            scored = self._parallel_analyze(distinct_texts, workers)
+        else:
+            scored = list(map(self.analyze_text, distinct_texts))
+        analyzed = dict(zip(distinct_texts, scored))
         
-        for row in survey_data:
-            text = row.get(column)
-            if text is not None and str(text).strip():
-                result = self.analyze_text(str(text))
-                sentiment_results.append(result)
-                total_responses += 1
+        # Repeats get their own copy so the per-row word lists stay independent
+        sentiment_results = []
+        issued = set()
+        for text in texts:
+            result = analyzed[text]
+            if text in issued:
+                result = dict(result,
+                              positive_words=result['positive_words'][:],
+                              negative_words=result['negative_words'][:])
+            else:
+                issued.add(text)
+            sentiment_results.append(result)
         
         if not sentiment_results:
             return {
@@ -194,10 +293,13 @@ class SentimentAnalyzer:
                 'total_responses': 0
             }
         
-        # Count sentiments
-        positive_count = sum(1 for r in sentiment_results if r['sentiment'] == 'positive')
-        negative_count = sum(1 for r in sentiment_results if r['sentiment'] == 'negative')
-        neutral_count = sum(1 for r in sentiment_results if r['sentiment'] == 'neutral')
+        # Count sentiments; this and the score sum below each run as one
+        # C-level pass over the results, in row order so the average score
+        # is summed exactly as before
+        sentiment_counts = Counter(map(_get_sentiment, sentiment_results))
+        positive_count = sentiment_counts['positive']
+        negative_count = sentiment_counts['negative']
+        neutral_count = sentiment_counts['neutral']
         
         # Calculate percentages
         total = len(sentiment_results)
@@ -206,7 +308,7 @@ class SentimentAnalyzer:
         neutral_pct = (neutral_count / total) * 100
         
         # Calculate average score
-        avg_score = sum(r['score'] for r in sentiment_results) / total
+        avg_score = sum(map(_get_score, sentiment_results)) / total
         
         return {
             'positive': positive_count,
@@ -220,6 +322,24 @@ class SentimentAnalyzer:
             'detailed_results': sentiment_results
         }
     
+    def _parallel_workers(self, texts: List[str]) -> int:
+        """Decide how many worker processes to score the distinct texts with."""
+        if len(texts) < 2 or sum(map(len, texts)) <= self.parallel_threshold:
+            return 1
+        return min(available_cpus(), self.max_workers, len(texts))
+    
+    def _parallel_analyze(self, texts: List[str], n_workers: int) -> List[Dict[str, Any]]:
+        """
+        Score texts in contiguous slices across worker processes.
+        
+        Returns the results in the order of the texts.
+        """
+        size = -(-len(texts) // n_workers)
+        slices = [texts[start:start + size] for start in range(0, len(texts), size)]
+        with ProcessPoolExecutor(max_workers=len(slices)) as executor:
+            futures = [executor.submit(_analyze_texts, self, chunk) for chunk in slices]
+            return [result for future in futures for result in future.result()]
+    
     def analyze_all_text_columns(self, survey_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze sentiment for all text columns in the survey data.
@@ -233,21 +353,22 @@ class SentimentAnalyzer:
         if not survey_data:
             return {}
         
-        text_columns = []
-        for col in survey_data[0].keys():
-            # Check if column contains text data
-            text_count = 0
-            total_count = 0
-            
-            for row in survey_data[:10]:  # Sample first 10 rows
-                value = row.get(col)
-                if value is not None and str(value).strip():
-                    total_count += 1
-                    if len(str(value)) > 20:  # Consider it text if longer than 20 chars
-                        text_count += 1
-            
-            if total_count > 0 and (text_count / total_count) > 0.3:
-                text_columns.append(col)
+        # Tally [non-empty, long] values per column over the first 10 rows
+        # in one pass, converting each sampled cell to str only once
+        tallies = {col: [0, 0] for col in survey_data[0]}
+        for row in survey_data[:10]:  # Sample first 10 rows
+            for col, value in row.items():
+                tally = tallies.get(col)
+                if tally is None or value is None:
+                    continue
+                value = str(value)
+                if value.strip():
+                    tally[0] += 1
+                    if len(value) > 20:  # Consider it text if longer than 20 chars
+                        tally[1] += 1
+        
+        text_columns = [col for col, (total_count, text_count) in tallies.items()
+                        if total_count > 0 and (text_count / total_count) > 0.3]
         
         results = {}
         for column in text_columns:
@@ -257,23 +378,20 @@ class SentimentAnalyzer:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for analysis."""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove punctuation (keep apostrophes for contractions)
-        text = re.sub(r'[^\w\s\']', ' ', text)
-        
-        return text.strip()
+        return _normalize_text(text)
     
     def _extract_words(self, text: str) -> List[str]:
         """Extract words from text."""
         return text.split()
     
     def _is_negated(self, words: List[str], current_index: int) -> bool:
-        """Check if current word is negated by previous words."""
+        """
+        Check if current word is negated by previous words.
+        
+        analyze_text does not call this per word; it carries the end of the
+        last negation's window forward instead, which gives the same answer
+        in one pass over the words.
+        """
         # Look back up to 3 words for negation
         start_index = max(0, current_index - 3)
         
@@ -298,20 +416,14 @@ class SentimentAnalyzer:
             return {}
         
         total_responses = len(sentiment_results)
-        positive_count = sum(1 for r in sentiment_results if r['sentiment'] == 'positive')
-        negative_count = sum(1 for r in sentiment_results if r['sentiment'] == 'negative')
-        neutral_count = sum(1 for r in sentiment_results if r['sentiment'] == 'neutral')
+        sentiment_counts = Counter(map(_get_sentiment, sentiment_results))
+        positive_count = sentiment_counts['positive']
+        negative_count = sentiment_counts['negative']
+        neutral_count = sentiment_counts['neutral']
         
         # Most common positive and negative words
-        all_positive_words = []
-        all_negative_words = []
-        
-        for result in sentiment_results:
-            all_positive_words.extend(result['positive_words'])
-            all_negative_words.extend(result['negative_words'])
-        
-        positive_word_counts = Counter(all_positive_words)
-        negative_word_counts = Counter(all_negative_words)
+        positive_word_counts = Counter(chain.from_iterable(map(_get_positive_words, sentiment_results)))
+        negative_word_counts = Counter(chain.from_iterable(map(_get_negative_words, sentiment_results)))
         
         return {
             'total_responses': total_responses,
@@ -322,28 +434,33 @@ class SentimentAnalyzer:
             },
             'top_positive_words': positive_word_counts.most_common(5),
             'top_negative_words': negative_word_counts.most_common(5),
-            'average_confidence': sum(r['confidence'] for r in sentiment_results) / total_responses,
-            'average_score': sum(r['score'] for r in sentiment_results) / total_responses
+            'average_confidence': sum(map(_get_confidence, sentiment_results)) / total_responses,
+            'average_score': sum(map(_get_score, sentiment_results)) / total_responses
         }
     
     def export_sentiment_report(self, sentiment_results: Dict[str, Any], filename: str = "sentiment_report.txt") -> bool:
         """Export sentiment analysis results to a text file."""
         try:
+            # Build the report in memory, one block per column, and write it
+            # with a single call once every column has been formatted
+            parts = ["SENTIMENT ANALYSIS REPORT\n", "=" * 50 + "\n\n"]
+            
+            for column, results in sentiment_results.items():
+                parts.append(
+                    f"Column: {column}\n"
+                    f"{'-' * 30}\n"
+                    f"Total Responses: {results['total_responses']}\n"
+                    f"Positive: {results['positive']} ({results['positive_pct']:.1f}%)\n"
+                    f"Negative: {results['negative']} ({results['negative_pct']:.1f}%)\n"
+                    f"Neutral: {results['neutral']} ({results['neutral_pct']:.1f}%)\n"
+                    f"Average Score: {results['avg_score']:.2f}\n\n"
+                )
+            
             with open(filename, 'w', encoding='utf-8') as file:
-                file.write("SENTIMENT ANALYSIS REPORT\n")
-                file.write("=" * 50 + "\n\n")
-                
-                for column, results in sentiment_results.items():
-                    file.write(f"Column: {column}\n")
-                    file.write("-" * 30 + "\n")
-                    file.write(f"Total Responses: {results['total_responses']}\n")
-                    file.write(f"Positive: {results['positive']} ({results['positive_pct']:.1f}%)\n")
-                    file.write(f"Negative: {results['negative']} ({results['negative_pct']:.1f}%)\n")
-                    file.write(f"Neutral: {results['neutral']} ({results['neutral_pct']:.1f}%)\n")
-                    file.write(f"Average Score: {results['avg_score']:.2f}\n\n")
+                file.write(''.join(parts))
                 
             return True
             
         except Exception as e:
             print(f"Error exporting sentiment report: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
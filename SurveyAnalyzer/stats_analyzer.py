@@ -7,9 +7,13 @@ chi-square tests, and correlation analysis on survey data.
 """
 
 import math
+import operator
 from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict, Counter
 import itertools
+import copy
+from itertools import repeat
+from utils import get_column
 
 
 class StatsAnalyzer:
@@ -25,6 +29,107 @@ class StatsAnalyzer:
         self.survey_data = survey_data
         self.total_responses = len(survey_data)
         self.columns = list(survey_data[0].keys()) if survey_data else []
+        # Cross-tabulations already computed, keyed by (col1, col2)
+        self._crosstab_cache = {}
+        # Per-column views converted once and shared by every test on the column
+        self._category_cache = {}
+        self._numeric_cache = {}
+        # Results of analyze_response_patterns and get_statistical_summary
+        self._patterns = None
+        self._summary = None
+    
+    def clear_cache(self):
+        """Discard cached tables and column views after survey_data has been modified."""
+        self._crosstab_cache.clear()
+        self._category_cache.clear()
+        self._numeric_cache.clear()
+        self._patterns = None
+        self._summary = None
+    
+    def _category_column(self, column: str) -> Tuple[List[str], List[str]]:
+        """
+        Get a column's cross-tabulation keys, converting the rows only once.
+        
+        Args:
+            column: Column name
+            
+        Returns:
+            Tuple of the per-row keys (str(value).strip(), with '' for a missing
+            value and 'None' for an explicit None) and the sorted categories
+            taken from rows with a non-empty, non-None value
+        """
+        cached = self._category_cache.get(column)
+        if cached is None:
+            values = [row.get(column, '') for row in self.survey_data]
+            distinct = self._distinct_strings(values)
+            if distinct is not None:
+                # Convert each distinct answer once
+                key_of = {value: str(value).strip() for value in distinct}
+                keys = list(map(key_of.__getitem__, values))
+                categories = set(key_of.values())
+                literal_none = any(key == 'None' and value is not None
+                                   for value, key in key_of.items())
+            else:
+                keys = list(map(str.strip, map(str, values)))
+                categories = set(keys)
+                literal_none = any(key == 'None' and value is not None
+                                   for value, key in zip(values, keys))
+            categories.discard('')
+            # A None value is keyed 'None' but only a literal answer makes it a category
+            if not literal_none:
+                categories.discard('None')
+            # Sorted once here rather than by every table the column is in
+            cached = self._category_cache[column] = (keys, sorted(categories))
+        return cached
+    
+    def _distinct_strings(self, values: List[Any]) -> Optional[set]:
+        """
+        Get the distinct values of a column if they are all str or None.
+        
+        Other values are not deduplicated: equal numbers such as 1, 1.0 and
+        True would share one set entry but not one string form.
+        """
+        try:
+            distinct = set(values)
+        except TypeError:
+            return None
+        if all(value is None or value.__class__ is str for value in distinct):
+            return distinct
+        return None
+    
+    def _numeric_column(self, column: str) -> List[Optional[float]]:
+        """
+        Get a column parsed as numbers, converting the rows only once.
+        
+        Args:
+            column: Column name
+            
+        Returns:
+            List with the float value of each row, or None where the value is
+            missing, blank or not numeric
+        """
+        numbers = self._numeric_cache.get(column)
+        if numbers is None:
+            numbers = []
+            parsed = {}  # Repeated string answers are parsed once
+            for value in get_column(self.survey_data, column):
+                if value.__class__ is str:
+                    if value not in parsed:
+                        parsed[value] = self._to_number(value)
+                    numbers.append(parsed[value])
+                else:
+                    numbers.append(self._to_number(value))
+            self._numeric_cache[column] = numbers
+        return numbers
+    
+    def _to_number(self, value: Any) -> Optional[float]:
+        """Convert a survey value to float, or None if it is blank or not numeric."""
+        if value is None or not str(value).strip():
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
         
     def cross_tabulate(self, col1: str, col2: str) -> List[List]:
         """
@@ -40,22 +145,21 @@ class StatsAnalyzer:
         if col1 not in self.columns or col2 not in self.columns:
             raise ValueError(f"Column not found: {col1} or {col2}")
         
-        # Get unique values for each column
-        values1 = set()
-        values2 = set()
-        
-        for row in self.survey_data:
-            val1 = row.get(col1)
-            val2 = row.get(col2)
-            
-            if val1 is not None and str(val1).strip():
-                values1.add(str(val1).strip())
-            if val2 is not None and str(val2).strip():
-                values2.add(str(val2).strip())
-        
-        # Sort values for consistent ordering
-        values1 = sorted(list(values1))
-        values2 = sorted(list(values2))
+        # Reuse an earlier table for the same pair, transposing it when the
+        # columns were requested the other way round. Callers get a copy so
+        # the cached table cannot be modified through the result.
+        cached = self._crosstab_cache.get((col1, col2))
+        if cached is not None:
+            return [row[:] for row in cached]
+        cached = self._crosstab_cache.get((col2, col1))
+        if cached is not None:
+            return [list(row) for row in zip(*cached)]
+        
+        # Count (val1, val2) pairs in a single pass over the two key columns
+        # The category lists come sorted, for consistent ordering
+        keys1, values1 = self._category_column(col1)
+        keys2, values2 = self._category_column(col2)
+        pair_counts = Counter(zip(keys1, keys2))
         
         # Create cross-tabulation matrix
         crosstab = []
@@ -67,30 +171,33 @@ class StatsAnalyzer:
         # Data rows
         for val1 in values1:
             row = [val1]
-            for val2 in values2:
-                count = 0
-                for survey_row in self.survey_data:
-                    if (str(survey_row.get(col1, '')).strip() == val1 and 
-                        str(survey_row.get(col2, '')).strip() == val2):
-                        count += 1
-                row.append(count)
+            row.extend(pair_counts.get((val1, val2), 0) for val2 in values2)
             crosstab.append(row)
         
+        self._crosstab_cache[col1, col2] = [row[:] for row in crosstab]
         return crosstab
     
-    def chi_square_test(self, col1: str, col2: str) -> Dict[str, Any]:
+    def chi_square_test(self, col1: str, col2: str,
+                        crosstab: Optional[List[List]] = None) -> Dict[str, Any]:
         """
         Perform chi-square test of independence between two categorical variables.
         
+        The statistic is Pearson's uncorrected chi-square; unlike the default
+        of scipy.stats.chi2_contingency, no Yates correction is applied to
+        2x2 tables.
+        
         Args:
             col1: First column name
             col2: Second column name
+            crosstab: Optional cross-tabulation of col1 vs col2 already computed
+                by cross_tabulate, to avoid tabulating the data twice
             
         Returns:
             Dictionary containing chi-square test results
         """
         # Get cross-tabulation
-        crosstab = self.cross_tabulate(col1, col2)
+        if crosstab is None:
+            crosstab = self.cross_tabulate(col1, col2)
         
         if len(crosstab) < 2 or len(crosstab[0]) < 2:
             return {
@@ -102,15 +209,10 @@ class StatsAnalyzer:
             }
         
         # Extract observed frequencies (skip header row and column)
-        observed = []
-        for i in range(1, len(crosstab)):
-            row = []
-            for j in range(1, len(crosstab[i])):
-                row.append(int(crosstab[i][j]))
-            observed.append(row)
+        observed = [list(map(int, row[1:])) for row in crosstab[1:]]
         
         # Check if we have enough data for chi-square test
-        total_observations = sum(sum(row) for row in observed)
+        total_observations = sum(map(sum, observed))
         if total_observations < 5:  # Chi-square test requires at least 5 observations
             return {
                 'chi_square': 0.0,
@@ -125,10 +227,10 @@ class StatsAnalyzer:
         
         # Calculate chi-square statistic
         chi_square = 0.0
-        for i in range(len(observed)):
-            for j in range(len(observed[i])):
-                if expected[i][j] > 0:
-                    chi_square += ((observed[i][j] - expected[i][j]) ** 2) / expected[i][j]
+        for observed_row, expected_row in zip(observed, expected):
+            for observed_freq, expected_freq in zip(observed_row, expected_row):
+                if expected_freq > 0:
+                    chi_square += ((observed_freq - expected_freq) ** 2) / expected_freq
         
         # Calculate degrees of freedom
         df = (len(observed) - 1) * (len(observed[0]) - 1)
@@ -157,39 +259,91 @@ class StatsAnalyzer:
         cols = len(observed[0])
         
         # Calculate row and column totals
-        row_totals = [sum(row) for row in observed]
-        col_totals = []
-        for j in range(cols):
-            col_totals.append(sum(observed[i][j] for i in range(rows)))
+        row_totals = list(map(sum, observed))
+        col_totals = list(map(sum, zip(*observed)))
         
         total = sum(row_totals)
+        if total <= 0:
+            return [[0] * cols for _ in range(rows)]
         
         # Calculate expected frequencies
-        expected = []
-        for i in range(rows):
-            row = []
-            for j in range(cols):
-                expected_freq = (row_totals[i] * col_totals[j]) / total if total > 0 else 0
-                row.append(expected_freq)
-            expected.append(row)
-        
-        return expected
+        return [[(row_total * col_total) / total for col_total in col_totals]
+                for row_total in row_totals]
     
     def _chi_square_p_value(self, chi_square: float, df: int) -> float:
         """
-        Calculate approximate p-value for chi-square statistic.
-        This is a simplified approximation - in practice, you'd use a proper chi-square distribution.
+        Calculate the p-value of a chi-square statistic.
+        
+        This is the chi-square survival function, P(X >= chi_square) for df
+        degrees of freedom, evaluated as the regularized upper incomplete
+        gamma function Q(df / 2, chi_square / 2).
+        
+        Args:
+            chi_square: Chi-square statistic
+            df: Degrees of freedom
+            
+        Returns:
+            P-value between 0.0 and 1.0
         """
-        if df <= 0:
+        if df <= 0 or chi_square <= 0:
             return 1.0
         
-        # Simple approximation for chi-square p-value
-        # For small chi-square values, p-value is close to 1
-        # For large chi-square values, p-value approaches 0
-        if chi_square < df:
-            return 1.0 - (chi_square / (df * 2))
-        else:
-            return max(0.0, 1.0 - (chi_square / (df * 10)))
+        return self._regularized_gamma_q(df / 2.0, chi_square / 2.0)
+    
+    def _regularized_gamma_q(self, a: float, x: float) -> float:
+        """
+        Calculate the regularized upper incomplete gamma function Q(a, x).
+        
+        Uses the power series for P(a, x) when x < a + 1 and a continued
+        fraction (modified Lentz's method) for Q(a, x) otherwise, the split at
+        which each converges quickly.
+        
+        Args:
+            a: Shape parameter (positive)
+            x: Integration limit (positive)
+            
+        Returns:
+            Q(a, x) between 0.0 and 1.0
+        """
+        max_iterations = 500
+        epsilon = 1e-15
+        tiny = 1e-300
+        # Common factor x^a * e^-x / Gamma(a), taken through logs to avoid overflow
+        log_prefactor = a * math.log(x) - x - math.lgamma(a)
+        
+        if x < a + 1.0:
+            # Series: P(a, x) = prefactor * sum(x^n / (a (a+1) ... (a+n)))
+            term = 1.0 / a
+            total = term
+            denominator = a
+            for _ in range(max_iterations):
+                denominator += 1.0
+                term *= x / denominator
+                total += term
+                if abs(term) < abs(total) * epsilon:
+                    break
+            return min(1.0, max(0.0, 1.0 - total * math.exp(log_prefactor)))
+        
+        # Continued fraction for Q(a, x)
+        b = x + 1.0 - a
+        c = 1.0 / tiny
+        d = 1.0 / b
+        fraction = d
+        for i in range(1, max_iterations + 1):
+            an = -i * (i - a)
+            b += 2.0
+            d = an * d + b
+            if abs(d) < tiny:
+                d = tiny
+            c = b + an / c
+            if abs(c) < tiny:
+                c = tiny
+            d = 1.0 / d
+            delta = d * c
+            fraction *= delta
+            if abs(delta - 1.0) < epsilon:
+                break
+        return min(1.0, max(0.0, fraction * math.exp(log_prefactor)))
     
     def correlation_analysis(self, col1: str, col2: str) -> Dict[str, Any]:
         """
@@ -202,24 +356,14 @@ class StatsAnalyzer:
         Returns:
             Dictionary containing correlation analysis results
         """
-        # Extract numeric values
+        # Pair up the rows where both values are numeric
         values1 = []
         values2 = []
         
-        for row in self.survey_data:
-            val1 = row.get(col1)
-            val2 = row.get(col2)
-            
-            # Try to convert to numeric
-            try:
-                if val1 is not None and str(val1).strip():
-                    num1 = float(val1)
-                    if val2 is not None and str(val2).strip():
-                        num2 = float(val2)
-                        values1.append(num1)
-                        values2.append(num2)
-            except (ValueError, TypeError):
-                continue
+        for num1, num2 in zip(self._numeric_column(col1), self._numeric_column(col2)):
+            if num1 is not None and num2 is not None:
+                values1.append(num1)
+                values2.append(num2)
         
         if len(values1) < 2:
             return {
@@ -248,10 +392,14 @@ class StatsAnalyzer:
         mean_x = sum(x) / n
         mean_y = sum(y) / n
         
+        # Deviations are computed once and shared by all three sums
+        deviations_x = [value - mean_x for value in x]
+        deviations_y = [value - mean_y for value in y]
+        
         # Calculate correlation coefficient
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        denominator_x = sum((x[i] - mean_x) ** 2 for i in range(n))
-        denominator_y = sum((y[i] - mean_y) ** 2 for i in range(n))
+        numerator = sum(map(operator.mul, deviations_x, deviations_y))
+        denominator_x = sum(map(pow, deviations_x, repeat(2)))
+        denominator_y = sum(map(pow, deviations_y, repeat(2)))
         
         if denominator_x == 0 or denominator_y == 0:
             return 0.0
@@ -275,41 +423,73 @@ class StatsAnalyzer:
             return "Very Weak"
     
     def analyze_response_patterns(self) -> Dict[str, Any]:
-        """Analyze patterns in survey responses."""
+        """
+        Analyze patterns in survey responses.
+        
+        The patterns are computed once and cached until clear_cache; every call
+        returns a fresh copy.
+        """
+        if self._patterns is not None:
+            return copy.deepcopy(self._patterns)
+        
         patterns = {
             'common_combinations': [],
             'response_clusters': [],
             'outliers': []
         }
         
-        # Find common combinations of responses
-        response_combinations = []
-        for row in self.survey_data:
-            combination = []
-            for col in self.columns:
-                value = row.get(col)
-                if value is not None and str(value).strip():
-                    combination.append(f"{col}:{str(value).strip()}")
+        # Count rows by their tuple of stripped values in column order, with ''
+        # for missing or blank answers. Counting one fixed-order tuple per row
+        # avoids building and sorting "col:value" strings for every row; that
+        # is only done once per distinct tuple below.
+        stripped_columns = list(map(self._stripped_column, self.columns))
+        value_counts = Counter(zip(*stripped_columns))
+        
+        # Fold the distinct tuples into their sorted combinations, in first-seen
+        # order so ties rank exactly as a row-by-row count would
+        combination_counts = Counter()
+        for values, count in value_counts.items():
+            combination = [f"{col}:{value}" for col, value in zip(self.columns, values) if value]
             if combination:
-                response_combinations.append(tuple(sorted(combination)))
+                combination_counts[tuple(sorted(combination))] += count
         
-        # Count combinations
-        combination_counts = Counter(response_combinations)
+        total_combinations = sum(combination_counts.values())
         common_combinations = combination_counts.most_common(5)
         
         patterns['common_combinations'] = [
             {
                 'combination': list(combo),
                 'count': count,
-                'percentage': (count / len(response_combinations)) * 100
+                'percentage': (count / total_combinations) * 100
             }
             for combo, count in common_combinations
         ]
         
-        return patterns
+        self._patterns = patterns
+        return copy.deepcopy(patterns)
+    
+    def _stripped_column(self, column: str) -> List[str]:
+        """Get a column's values as stripped strings, with '' for missing values."""
+        values = get_column(self.survey_data, column)
+        distinct = self._distinct_strings(values)
+        if distinct is None:
+            return ['' if value is None else str(value).strip() for value in values]
+        
+        # Strip each distinct answer once
+        stripped = {value: value.strip() for value in distinct if value is not None}
+        stripped[None] = ''
+        return list(map(stripped.__getitem__, values))
     
     def get_statistical_summary(self) -> Dict[str, Any]:
-        """Generate a comprehensive statistical summary."""
+        """
+        Generate a comprehensive statistical summary.
+        
+        The summary is computed once and cached until clear_cache; every call
+        returns a fresh copy.
+        """
+        if self._summary is not None:
+            return copy.deepcopy(self._summary)
+        
         summary = {
             'total_responses': self.total_responses,
             'total_columns': len(self.columns),
@@ -318,18 +498,23 @@ class StatsAnalyzer:
             'statistical_tests': []
         }
         
-        # Categorize columns
+        # Categorize columns, trying float() once per distinct answer
         for column in self.columns:
+            values = get_column(self.survey_data, column)
+            value_counts = Counter(map(str, values))
+            # str(None) is 'None'; only a literal 'None' answer counts as a value
+            if 'None' in value_counts:
+                value_counts['None'] -= values.count(None)
+            
             numeric_count = 0
             total_count = 0
             
-            for row in self.survey_data:
-                value = row.get(column)
-                if value is not None and str(value).strip():
-                    total_count += 1
+            for text, count in value_counts.items():
+                if count and text.strip():
+                    total_count += count
                     try:
-                        float(str(value))
-                        numeric_count += 1
+                        float(text)
+                        numeric_count += count
                     except (ValueError, TypeError):
                         pass
             
@@ -338,7 +523,8 @@ class StatsAnalyzer:
             else:
                 summary['categorical_columns'].append(column)
         
-        return summary
+        self._summary = summary
+        return copy.deepcopy(summary)
     
     def perform_multiple_chi_square_tests(self, target_column: str) -> List[Dict[str, Any]]:
         """
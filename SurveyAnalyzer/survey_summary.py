@@ -5,13 +5,41 @@ Description: Generates summary statistics, response counts, percentages,
 and demographic breakdowns for survey data analysis.
 """
 
-import statistics
-from typing import List, Dict, Any, Optional
+import copy
+import heapq
+import io
+from typing import List, Dict, Any, Optional, Tuple
+from bisect import bisect_right
 from collections import defaultdict, Counter
+from functools import lru_cache, partial
+from operator import is_not, itemgetter
+from utils import get_column
+
+# Common demographic fields, in report order, and as a set for the
+# per-column "is this a question?" checks
+_DEMOGRAPHIC_FIELDS = ('age', 'gender', 'region', 'education', 'income')
+_DEMOGRAPHIC_FIELD_SET = frozenset(_DEMOGRAPHIC_FIELDS)
+
+# Age groups reported by get_age_distribution, with the lowest age of each;
+# ages below the first bound are not counted
+_AGE_GROUPS = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
+_AGE_BOUNDS = [18, 26, 36, 46, 56, 66]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_response(text: str) -> str:
+    """Normalize a demographic answer by stripping and title-casing it."""
+    return text.strip().title()
 
 
 class SurveySummary:
-    """Handles generation of survey summary statistics and demographic breakdowns."""
+    """
+    Handles generation of survey summary statistics and demographic breakdowns.
+    
+    Every aggregate reads whole columns through get_column, so data loaded as
+    a SurveyFrame is consumed through its shared columnar view instead of
+    being walked row dict by row dict.
+    """
     
     def __init__(self, survey_data: List[Dict[str, Any]]):
         """
@@ -23,16 +51,54 @@ class SurveySummary:
         self.survey_data = survey_data
         self.total_responses = len(survey_data)
         self.columns = list(survey_data[0].keys()) if survey_data else []
+        self._column_set = frozenset(self.columns)
+        # Result of generate_summary, kept for repeated calls
+        self._summary = None
+        # Per-column response tables, built on first use by _column_profile
+        self._profiles = {}
+        # Normalized demographic counts, built on first use by _count_responses_by_field
+        self._field_counts = {}
+    
+    def _column_profile(self, column: str) -> Tuple[Counter, int]:
+        """
+        Get a column's valid response counts and its number of missing responses.
+        
+        Demographic breakdowns, question summaries, data quality and trends
+        are all derived from these tables, so each column is scanned once no
+        matter how many of them are generated.
+        
+        Args:
+            column: Column name
+            
+        Returns:
+            Tuple of a Counter of the valid (non-None, non-blank) responses, in
+            first-seen order, and the count of missing or blank responses
+        """
+        profile = self._profiles.get(column)
+        if profile is None:
+            # Counter does the only per-cell work, in C; the missing/blank
+            # test below then runs once per distinct value
+            counts = Counter(get_column(self.survey_data, column))
+            missing = counts.pop(None, 0)
+            for value in [value for value in counts if not str(value).strip()]:
+                missing += counts.pop(value)
+            profile = self._profiles[column] = (counts, missing)
+        return profile
         
     def generate_summary(self) -> Dict[str, Any]:
         """
         Generate comprehensive summary statistics.
         
+        The summary is computed once and cached; every call returns a fresh
+        copy.
+        
         Returns:
             Dictionary containing all summary statistics
         """
         if not self.survey_data:
             return {}
+        if self._summary is not None:
+            return copy.deepcopy(self._summary)
             
         summary = {
             'total_responses': self.total_responses,
@@ -42,7 +108,8 @@ class SurveySummary:
             'data_quality': self._assess_data_quality()
         }
         
-        return summary
+        self._summary = summary
+        return copy.deepcopy(summary)
     
     def _calculate_response_rate(self) -> float:
         """Calculate the response rate (placeholder for actual calculation)."""
@@ -54,11 +121,8 @@ class SurveySummary:
         """Analyze demographic breakdowns."""
         demographics = {}
         
-        # Common demographic fields
-        demo_fields = ['age', 'gender', 'region', 'education', 'income']
-        
-        for field in demo_fields:
-            if field in self.columns:
+        for field in _DEMOGRAPHIC_FIELDS:
+            if field in self._column_set:
                 demographics[field] = self._count_responses_by_field(field)
         
         return demographics
@@ -68,159 +132,178 @@ class SurveySummary:
         question_summaries = {}
         
         for column in self.columns:
-            if column not in ['age', 'gender', 'region', 'education', 'income']:
+            if column not in _DEMOGRAPHIC_FIELD_SET:
                 question_summaries[column] = self._analyze_question_responses(column)
         
         return question_summaries
     
     def _count_responses_by_field(self, field: str) -> Dict[str, int]:
         """Count responses for a specific field."""
-        counts = Counter()
+        # The summary and the demographic report both break the same fields
+        # down, so the normalized counts are kept and handed out as copies
+        field_counts = self._field_counts.get(field)
+        if field_counts is None:
+            field_counts = self._field_counts[field] = self._normalized_counts(field)
+        return dict(field_counts)
+    
+    def _normalized_counts(self, field: str) -> Dict[str, int]:
+        """Count a field's responses by their stripped, title-cased form."""
+        response_counts, _ = self._column_profile(field)
+        
+        if any(value.__class__ is not str for value in response_counts):
+            # Equal non-string values (1, 1.0, True) share a Counter key but not
+            # a string form, so normalize those columns value by value
+            present = filter(partial(is_not, None), get_column(self.survey_data, field))
+            normalized_values = map(_normalize_response, map(str, present))
+            # Blank answers normalize to '', which filter(None, ...) drops
+            return dict(Counter(filter(None, normalized_values)))
+        
+        # Normalize each distinct response once; cleaned data (e.g. title-cased
+        # answers from the sample survey) is usually normalized already, and
+        # then the column's counts are the answer as they stand
+        responses = list(response_counts)
+        normalized_responses = list(map(_normalize_response, responses))
+        if normalized_responses == responses:
+            return dict(response_counts)
         
-        for row in self.survey_data:
-            value = row.get(field)
-            if value is not None and str(value).strip():
-                # Normalize the value
-                normalized_value = str(value).strip().title()
-                counts[normalized_value] += 1
+        counts = Counter()
+        for response, count in zip(normalized_responses, response_counts.values()):
+            counts[response] += count
         
         return dict(counts)
     
     def _analyze_question_responses(self, question: str) -> Dict[str, Any]:
         """Analyze responses for a specific question."""
-        responses = [row.get(question) for row in self.survey_data]
-        valid_responses = [r for r in responses if r is not None and str(r).strip()]
+        response_counts, missing_responses = self._column_profile(question)
+        total_valid = sum(response_counts.values())
+        total_responses = total_valid + missing_responses
         
-        if not valid_responses:
+        if not total_valid:
             return {
                 'total_responses': 0,
-                'missing_responses': len(responses),
+                'missing_responses': total_responses,
                 'response_rate': 0.0,
                 'top_responses': [],
                 'response_distribution': {}
             }
         
-        # Count responses
-        response_counts = Counter(valid_responses)
-        
         # Calculate percentages
-        total_valid = len(valid_responses)
-        response_distribution = {}
-        for response, count in response_counts.items():
-            percentage = (count / total_valid) * 100
-            response_distribution[response] = {
-                'count': count,
-                'percentage': percentage
-            }
+        response_distribution = {
+            response: {'count': count, 'percentage': (count / total_valid) * 100}
+            for response, count in response_counts.items()
+        }
         
-        # Get top responses
-        top_responses = response_counts.most_common(5)
+        # Get top responses, by a bounded heap walk over the distinct answers
+        # (the same selection and tie order as Counter.most_common(5))
+        top_responses = heapq.nlargest(5, response_counts.items(), key=itemgetter(1))
         
         return {
             'total_responses': total_valid,
-            'missing_responses': len(responses) - total_valid,
-            'response_rate': (total_valid / len(responses)) * 100,
+            'missing_responses': missing_responses,
+            'response_rate': (total_valid / total_responses) * 100,
             'top_responses': top_responses,
             'response_distribution': response_distribution
         }
     
     def _assess_data_quality(self) -> Dict[str, Any]:
         """Assess the quality of the survey data."""
+        total_rows = len(self.survey_data)
+        missing_data = {}
+        completeness = {}
         quality_metrics = {
-            'total_rows': len(self.survey_data),
+            'total_rows': total_rows,
             'total_columns': len(self.columns),
-            'missing_data': {},
-            'completeness': {}
+            'missing_data': missing_data,
+            'completeness': completeness
         }
         
-        # Analyze missing data for each column
+        # Analyze missing data for each column; the missing counts come from
+        # the column profiles, so no column is traversed again here
         for column in self.columns:
-            values = [row.get(column) for row in self.survey_data]
-            missing_count = sum(1 for v in values if v is None or str(v).strip() == '')
-            missing_percentage = (missing_count / len(values)) * 100
+            _, missing_count = self._column_profile(column)
+            missing_percentage = (missing_count / total_rows) * 100
             
-            quality_metrics['missing_data'][column] = {
+            missing_data[column] = {
                 'count': missing_count,
                 'percentage': missing_percentage
             }
             
-            quality_metrics['completeness'][column] = 100 - missing_percentage
+            completeness[column] = 100 - missing_percentage
         
         return quality_metrics
     
     def get_age_distribution(self) -> Dict[str, int]:
         """Get age distribution if age data is available."""
-        if 'age' not in self.columns:
+        if 'age' not in self._column_set:
             return {}
         
-        age_groups = {
-            '18-25': 0,
-            '26-35': 0,
-            '36-45': 0,
-            '46-55': 0,
-            '56-65': 0,
-            '65+': 0
-        }
+        # Bucket each distinct age once, by binary search over the group bounds
+        age_groups = dict.fromkeys(_AGE_GROUPS, 0)
+        for age, count in self._age_counts().items():
+            group = bisect_right(_AGE_BOUNDS, age)
+            if group:
+                age_groups[_AGE_GROUPS[group - 1]] += count
         
-        for row in self.survey_data:
-            age_str = row.get('age')
-            if age_str and str(age_str).isdigit():
+        return age_groups
+    
+    def _age_counts(self) -> Counter:
+        """
+        Count the ages given as whole numbers, parsing each distinct answer once.
+        
+        Returns:
+            Counter of integer ages, in first-seen order
+        """
+        response_counts, _ = self._column_profile('age')
+        if any(value.__class__ is not str for value in response_counts):
+            # Non-string answers are parsed cell by cell, see _normalized_counts
+            answers = [(value, 1) for value in get_column(self.survey_data, 'age')]
+        else:
+            answers = response_counts.items()
+        
+        ages = Counter()
+        for age_str, count in answers:
+            if age_str and str(age_str).isdecimal():
                 try:
-                    age = int(age_str)
-                    if 18 <= age <= 25:
-                        age_groups['18-25'] += 1
-                    elif 26 <= age <= 35:
-                        age_groups['26-35'] += 1
-                    elif 36 <= age <= 45:
-                        age_groups['36-45'] += 1
-                    elif 46 <= age <= 55:
-                        age_groups['46-55'] += 1
-                    elif 56 <= age <= 65:
-                        age_groups['56-65'] += 1
-                    elif age > 65:
-                        age_groups['65+'] += 1
+                    ages[int(age_str)] += count
                 except ValueError:
-                    continue
-        
-        return age_groups
+                    continue  # Too many digits to convert
+        return ages
     
     def get_gender_distribution(self) -> Dict[str, int]:
         """Get gender distribution if gender data is available."""
-        if 'gender' not in self.columns:
+        if 'gender' not in self._column_set:
             return {}
         
         return self._count_responses_by_field('gender')
     
     def get_regional_distribution(self) -> Dict[str, int]:
         """Get regional distribution if region data is available."""
-        if 'region' not in self.columns:
+        if 'region' not in self._column_set:
             return {}
         
         return self._count_responses_by_field('region')
     
     def get_education_distribution(self) -> Dict[str, int]:
         """Get education distribution if education data is available."""
-        if 'education' not in self.columns:
+        if 'education' not in self._column_set:
             return {}
         
         return self._count_responses_by_field('education')
     
     def calculate_average_age(self) -> Optional[float]:
         """Calculate average age if age data is available."""
-        if 'age' not in self.columns:
+        if 'age' not in self._column_set:
             return None
         
-        ages = []
-        for row in self.survey_data:
-            age_str = row.get('age')
-            if age_str and str(age_str).isdigit():
-                try:
-                    ages.append(int(age_str))
-                except ValueError:
-                    continue
-        
+        ages = self._age_counts()
         if ages:
-            return statistics.mean(ages)
+            # Exact integer mean, weighted by how often each age occurs: a
+            # whole result stays an int and anything else is the correctly
+            # rounded quotient, as statistics.mean returns for integer data
+            total_age = sum(age * count for age, count in ages.items())
+            total_count = sum(ages.values())
+            quotient, remainder = divmod(total_age, total_count)
+            return quotient if not remainder else total_age / total_count
         return None
     
     def get_response_trends(self) -> Dict[str, Any]:
@@ -233,19 +316,16 @@ class SurveySummary:
         
         # Find most common responses for each question
         for column in self.columns:
-            if column not in ['age', 'gender', 'region', 'education', 'income']:
-                responses = [row.get(column) for row in self.survey_data]
-                valid_responses = [r for r in responses if r is not None and str(r).strip()]
+            if column not in _DEMOGRAPHIC_FIELD_SET:
+                response_counts, _ = self._column_profile(column)
                 
-                if valid_responses:
-                    response_counts = Counter(valid_responses)
-                    most_common = response_counts.most_common(1)
-                    if most_common:
-                        trends['most_common_responses'][column] = {
-                            'response': most_common[0][0],
-                            'count': most_common[0][1],
-                            'percentage': (most_common[0][1] / len(valid_responses)) * 100
-                        }
+                if response_counts:
+                    response, count = max(response_counts.items(), key=itemgetter(1))
+                    trends['most_common_responses'][column] = {
+                        'response': response,
+                        'count': count,
+                        'percentage': (count / sum(response_counts.values())) * 100
+                    }
         
         return trends
     
@@ -254,46 +334,27 @@ class SurveySummary:
         if not self.survey_data:
             return "No data available for demographic analysis."
         
-        report_lines = []
-        report_lines.append("DEMOGRAPHIC ANALYSIS REPORT")
-        report_lines.append("=" * 50)
-        report_lines.append(f"Total Responses: {self.total_responses}")
-        report_lines.append("")
-        
-        # Age distribution
-        age_dist = self.get_age_distribution()
-        if age_dist:
-            report_lines.append("AGE DISTRIBUTION:")
-            for age_group, count in age_dist.items():
-                percentage = (count / self.total_responses) * 100
-                report_lines.append(f"  {age_group}: {count} ({percentage:.1f}%)")
-            report_lines.append("")
-        
-        # Gender distribution
-        gender_dist = self.get_gender_distribution()
-        if gender_dist:
-            report_lines.append("GENDER DISTRIBUTION:")
-            for gender, count in gender_dist.items():
-                percentage = (count / self.total_responses) * 100
-                report_lines.append(f"  {gender}: {count} ({percentage:.1f}%)")
-            report_lines.append("")
-        
-        # Regional distribution
-        region_dist = self.get_regional_distribution()
-        if region_dist:
-            report_lines.append("REGIONAL DISTRIBUTION:")
-            for region, count in region_dist.items():
-                percentage = (count / self.total_responses) * 100
-                report_lines.append(f"  {region}: {count} ({percentage:.1f}%)")
-            report_lines.append("")
-        
-        # Education distribution
-        education_dist = self.get_education_distribution()
-        if education_dist:
-            report_lines.append("EDUCATION DISTRIBUTION:")
-            for education, count in education_dist.items():
+        report = io.StringIO()
+        report.write("DEMOGRAPHIC ANALYSIS REPORT\n")
+        report.write("=" * 50 + "\n")
+        report.write(f"Total Responses: {self.total_responses}\n")
+        report.write("\n")
+        
+        sections = (
+            ("AGE DISTRIBUTION:", self.get_age_distribution()),
+            ("GENDER DISTRIBUTION:", self.get_gender_distribution()),
+            ("REGIONAL DISTRIBUTION:", self.get_regional_distribution()),
+            ("EDUCATION DISTRIBUTION:", self.get_education_distribution()),
+        )
+        for title, distribution in sections:
+            if not distribution:
+                continue
+            report.write(f"{title}\n")
+            for group, count in distribution.items():
                 percentage = (count / self.total_responses) * 100
-                report_lines.append(f"  {education}: {count} ({percentage:.1f}%)")
-            report_lines.append("")
+                report.write(f"  {group}: {count} ({percentage:.1f}%)\n")
+            report.write("\n")
         
-        return "\n".join(report_lines) 
\ No newline at end of file
+        # Every line, including the last blank one, ends in a newline; the
+        # report itself stops before the final one
+        return report.getvalue()[:-1] 
\ No newline at end of file
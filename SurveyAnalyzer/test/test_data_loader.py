@@ -18,17 +18,26 @@ from data_loader import DataLoader
 class TestDataLoader(unittest.TestCase):
     """Test cases for the DataLoader class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests."""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        cls._temp_dir.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
         self.data_loader = DataLoader()
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = self._temp_dir.name
         
     def tearDown(self):
         """Clean up test fixtures."""
         # Clean up temporary files
         for file in os.listdir(self.temp_dir):
             os.remove(os.path.join(self.temp_dir, file))
-        os.rmdir(self.temp_dir)
     
     def test_validate_file_existing(self):
         """Test file validation with existing file."""
@@ -57,9 +66,9 @@ class TestDataLoader(unittest.TestCase):
     def test_validate_file_too_large(self):
         """Test file validation with file too large."""
         temp_file = os.path.join(self.temp_dir, "large.csv")
-        # Create a file larger than 50MB
-        with open(temp_file, 'w') as f:
-            f.write("x" * (51 * 1024 * 1024))  # 51MB
+        # Create a file larger than 50MB (sparse, nothing is actually written)
+        with open(temp_file, 'wb') as f:
+            f.truncate(51 * 1024 * 1024)  # 51MB
         
         result = self.data_loader._validate_file(temp_file)
         self.assertFalse(result)
@@ -129,6 +138,18 @@ class TestDataLoader(unittest.TestCase):
         # Should filter out invalid age
         self.assertEqual(len(result), 2)
     
+    def test_clean_and_validate_data_oversized_age(self):
+        """Test data cleaning with an age too long to parse as an integer."""
+        test_data = [
+            {'age': '25', 'gender': 'Male', 'region': 'North'},
+            {'age': '9' * 5000, 'gender': 'Female', 'region': 'South'},  # Invalid age
+            {'age': '0035', 'gender': 'Male', 'region': 'East'}
+        ]
+        
+        result = self.data_loader._clean_and_validate_data(test_data)
+        self.assertIsNotNone(result)
+        self.assertEqual(len(result), 2)
+    
     def test_clean_and_validate_data_invalid_gender(self):
         """Test data cleaning with invalid gender data."""
         test_data = [
@@ -225,6 +246,18 @@ class TestDataLoader(unittest.TestCase):
         self.assertEqual(len(result), 3)
         self.assertEqual(result[0]['age'], '25')
         self.assertEqual(result[0]['gender'], 'Male')
+    
+    def test_load_csv_columns(self):
+        """Test the columnar view of loaded data."""
+        temp_file = os.path.join(self.temp_dir, "columns_test.csv")
+        
+        with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+            f.write("age,gender,region\n25,Male,North\n30,Female,NA\n")
+        
+        result = self.data_loader.load_csv(temp_file)
+        self.assertIsInstance(result, list)
+        self.assertEqual(result.columns['age'], ['25', '30'])
+        self.assertEqual(result.columns['region'], ['North', None])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Pattern Detector Module
+Author: Student Developer
+Description: Unit tests for pattern detection results.
+"""
+
+import unittest
+import json
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pattern_detector import PatternDetector
+
+
+class TestPatternDetector(unittest.TestCase):
+    """Test cases for the PatternDetector class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_data = [
+            {'age': str(20 + i % 50), 'gender': ['Male', 'Female'][i % 2],
+             'region': ['North', 'South'][i % 3 % 2], 'q1': ['good', 'bad'][i % 2],
+             'q2': ['great', 'poor'][i % 2]}
+            for i in range(200)
+        ]
+        self.pattern_detector = PatternDetector(self.test_data)
+
+    def test_find_patterns_returns_dicts(self):
+        """Test that patterns are plain, serializable dictionaries."""
+        patterns = self.pattern_detector.find_patterns()
+
+        self.assertGreater(len(patterns), 0)
+        for pattern in patterns:
+            self.assertIsInstance(pattern, dict)
+            self.assertIn('type', pattern)
+            self.assertIn('confidence', pattern)
+        self.assertEqual(json.loads(json.dumps(patterns)), patterns)
+
+        # Annotating a returned pattern must not change later results
+        patterns[0]['note'] = 'reviewed'
+        self.assertNotIn('note', self.pattern_detector.find_patterns()[0])
+
+    def test_nested_pattern_fields_are_copied(self):
+        """Test that changing a nested field of a returned pattern does not change later results."""
+        patterns = self.pattern_detector.find_patterns()
+        expected = list(patterns[0]['affected_groups'])
+
+        patterns[0]['affected_groups'].append('changed')
+        self.assertEqual(self.pattern_detector.find_patterns()[0]['affected_groups'], expected)
+
+        summary = self.pattern_detector.get_pattern_summary()
+        for key in ('high_confidence_patterns', 'medium_confidence_patterns', 'low_confidence_patterns'):
+            for pattern in summary[key]:
+                self.assertNotIn('changed', pattern.get('affected_groups', []))
+
+    def test_get_pattern_summary_returns_dicts(self):
+        """Test that the summary lists patterns as dictionaries."""
+        summary = self.pattern_detector.get_pattern_summary()
+
+        self.assertEqual(summary['total_patterns'], len(self.pattern_detector.find_patterns()))
+        for key in ('high_confidence_patterns', 'medium_confidence_patterns', 'low_confidence_patterns'):
+            for pattern in summary[key]:
+                self.assertIsInstance(pattern, dict)
+        json.dumps(summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
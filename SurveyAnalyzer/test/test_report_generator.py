@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Report Generator Module
+Author: Student Developer
+Description: Unit tests for writing survey analysis reports to disk.
+"""
+
+import unittest
+import tempfile
+import stat
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from report_generator import ReportGenerator
+
+
+class TestReportGenerator(unittest.TestCase):
+    """Test cases for the ReportGenerator class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.report_generator = ReportGenerator()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self._temp_dir.cleanup()
+
+    def test_generate_report_writes_file(self):
+        """Test that a report is written to the requested path."""
+        report_file = os.path.join(self.temp_dir, "report.txt")
+
+        result = self.report_generator.generate_report({'summary': {}, 'file_path': report_file})
+        self.assertTrue(result)
+
+        with open(report_file, 'r', encoding='utf-8') as f:
+            self.assertIn('SURVEY', f.read())
+        self.assertEqual(os.listdir(self.temp_dir), ["report.txt"])
+
+    def test_generate_report_failure_keeps_existing_file(self):
+        """Test that an existing report survives a failed build."""
+        report_file = os.path.join(self.temp_dir, "old.txt")
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("old report\n")
+
+        # A malformed summary makes building the report fail
+        result = self.report_generator.generate_report({'summary': {'demographics': 5},
+                                                        'file_path': report_file})
+        self.assertFalse(result)
+
+        with open(report_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "old report\n")
+        self.assertEqual(os.listdir(self.temp_dir), ["old.txt"])
+
+    def test_generate_report_keeps_permissions(self):
+        """Test that a new report follows the umask and a replaced one keeps its mode."""
+        report_file = os.path.join(self.temp_dir, "report.txt")
+
+        umask = os.umask(0o027)
+        try:
+            self.assertTrue(self.report_generator.generate_report({'summary': {}, 'file_path': report_file}))
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(report_file).st_mode), 0o640)
+
+        os.chmod(report_file, 0o600)
+        self.assertTrue(self.report_generator.generate_report({'summary': {}, 'file_path': report_file}))
+        self.assertEqual(stat.S_IMODE(os.stat(report_file).st_mode), 0o600)
+
+    def test_generate_report_through_symlink(self):
+        """Test that a symlinked report path keeps the link and updates its target."""
+        real_file = os.path.join(self.temp_dir, "real.txt")
+        link_file = os.path.join(self.temp_dir, "link.txt")
+        with open(real_file, 'w', encoding='utf-8') as f:
+            f.write("old report\n")
+        os.symlink(real_file, link_file)
+
+        self.assertTrue(self.report_generator.generate_report({'summary': {}, 'file_path': link_file}))
+
+        self.assertTrue(os.path.islink(link_file))
+        with open(real_file, 'r', encoding='utf-8') as f:
+            self.assertIn('SURVEY', f.read())
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["link.txt", "real.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
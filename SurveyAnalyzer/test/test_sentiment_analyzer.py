@@ -15,9 +15,14 @@ from sentiment_analyzer import SentimentAnalyzer
 class TestSentimentAnalyzer(unittest.TestCase):
     """Test cases for the SentimentAnalyzer class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the analyzer once; no test modifies its keyword dictionaries."""
+        cls._sentiment_analyzer = SentimentAnalyzer()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.sentiment_analyzer = SentimentAnalyzer()
+        self.sentiment_analyzer = self._sentiment_analyzer
         self.test_data = [
             {'feedback': 'This is excellent! I love it.', 'satisfaction': 'Very Satisfied'},
             {'feedback': 'Terrible experience, very bad service.', 'satisfaction': 'Dissatisfied'},
@@ -172,6 +177,15 @@ class TestSentimentAnalyzer(unittest.TestCase):
         self.assertIn('test', words)
         self.assertIn('sentence.', words)
     
+    def test_analyze_text_matches_cleaned_words(self):
+        """Test that scoring sees the same words as _clean_text/_extract_words."""
+        text = "  NOT good!!!\tIt's   very-BAD,so—slow... don't recommend  "
+        words = self.sentiment_analyzer._extract_words(self.sentiment_analyzer._clean_text(text))
+        result = self.sentiment_analyzer.analyze_text(text)
+
+        self.assertEqual(result['total_words'], len(words))
+        self.assertEqual(result['negative_words'], ['good', 'bad', 'slow', 'recommend'])
+
     def test_is_negated(self):
         """Test negation detection."""
         words = ['This', 'is', 'not', 'good']
@@ -56,7 +56,27 @@ class TestStatsAnalyzer(unittest.TestCase):
         """Test cross-tabulation with invalid columns."""
         with self.assertRaises(ValueError):
             self.stats_analyzer.cross_tabulate('invalid_column', 'gender')
-    
+
+    def test_cross_tabulate_cached(self):
+        """Test that repeated and swapped cross-tabulations reuse the cache."""
+        crosstab = self.stats_analyzer.cross_tabulate('gender', 'region')
+        crosstab[1][1] = 99  # Modifying a result must not affect the cache
+
+        self.assertEqual(self.stats_analyzer.cross_tabulate('gender', 'region'),
+                         [['', 'East', 'North', 'South'],
+                          ['Female', 1, 1, 1],
+                          ['Male', 1, 1, 1]])
+        self.assertEqual(self.stats_analyzer.cross_tabulate('region', 'gender'),
+                         [['', 'Female', 'Male'],
+                          ['East', 1, 1],
+                          ['North', 1, 1],
+                          ['South', 1, 1]])
+
+        # Clearing the cache picks up changes to the data
+        self.test_data.append({'age': '50', 'gender': 'Male', 'region': 'West', 'satisfaction': 'High'})
+        self.stats_analyzer.clear_cache()
+        self.assertEqual(self.stats_analyzer.cross_tabulate('region', 'gender')[-1], ['West', 0, 1])
+
     def test_chi_square_test_valid_data(self):
         """Test chi-square test with valid data."""
         result = self.stats_analyzer.chi_square_test('gender', 'satisfaction')
@@ -198,6 +218,22 @@ class TestStatsAnalyzer(unittest.TestCase):
         self.assertIsInstance(summary['numeric_columns'], list)
         self.assertIsInstance(summary['categorical_columns'], list)
     
+    def test_cached_results_are_copies(self):
+        """Test that changing a returned result does not change later results."""
+        patterns = self.stats_analyzer.analyze_response_patterns()
+        patterns['outliers'].append('changed')
+        patterns['common_combinations'][0]['count'] = -1
+        patterns = self.stats_analyzer.analyze_response_patterns()
+        self.assertEqual(patterns['outliers'], [])
+        self.assertNotEqual(patterns['common_combinations'][0]['count'], -1)
+        
+        summary = self.stats_analyzer.get_statistical_summary()
+        summary['numeric_columns'].append('changed')
+        summary['total_responses'] = 0
+        summary = self.stats_analyzer.get_statistical_summary()
+        self.assertNotIn('changed', summary['numeric_columns'])
+        self.assertEqual(summary['total_responses'], 6)
+    
     def test_perform_multiple_chi_square_tests(self):
         """Test multiple chi-square tests."""
         results = self.stats_analyzer.perform_multiple_chi_square_tests('gender')
@@ -241,6 +277,15 @@ class TestStatsAnalyzer(unittest.TestCase):
         p_value = self.stats_analyzer._chi_square_p_value(5.0, 0)
         self.assertEqual(p_value, 1.0)
 
+    def test_chi_square_p_value_critical_values(self):
+        """Test chi-square p-values against tabulated critical values."""
+        # 5% and 1% critical values of the chi-square distribution
+        self.assertAlmostEqual(self.stats_analyzer._chi_square_p_value(3.841, 1), 0.05, places=4)
+        self.assertAlmostEqual(self.stats_analyzer._chi_square_p_value(5.991, 2), 0.05, places=4)
+        self.assertAlmostEqual(self.stats_analyzer._chi_square_p_value(18.307, 10), 0.05, places=4)
+        self.assertAlmostEqual(self.stats_analyzer._chi_square_p_value(6.635, 1), 0.01, places=4)
+        self.assertAlmostEqual(self.stats_analyzer._chi_square_p_value(0.0, 3), 1.0)
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
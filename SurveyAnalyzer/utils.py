@@ -6,27 +6,103 @@ including display formatting, input validation, and common operations.
 """
 
 import os
+import stat
 import sys
+import time
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
+# Accepted gender answers, matched case-sensitively after stripping
+_VALID_GENDERS = frozenset([
+    'male', 'female', 'm', 'f', 'other', 'prefer not to say',
+    'Male', 'Female', 'M', 'F', 'Other', 'Prefer not to say'
+])
+
+# Characters not allowed in filenames
+_INVALID_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+
+# Minimum seconds between progress bar redraws, and when the last one was drawn
+_PROGRESS_INTERVAL = 0.1
+_last_progress_draw = [0.0]
+
+# File size units above bytes, largest first, with their size in bytes
+_FILE_SIZE_UNITS = (('GB', 1024.0 ** 3), ('MB', 1024.0 ** 2), ('KB', 1024.0))
+
+# ANSI escape sequence clearing the terminal and its scrollback, and the
+# platform's clear command used where the sequence can't be relied on
+_CLEAR_SCREEN = '\033[H\033[2J\033[3J'
+_IS_WINDOWS = os.name == 'nt'
+_CLEAR_COMMAND = 'cls' if _IS_WINDOWS else 'clear'
+
+# Progress bar width, and the full and empty bars its halves are sliced from
+_BAR_LENGTH = 30
+_BAR_FILLED = '█' * _BAR_LENGTH
+_BAR_EMPTY = '-' * _BAR_LENGTH
+
+# Rule drawn above and below print_header's title
+_HEADER_RULE = '=' * 60
+
+# Answers accepted as a yes by confirm_action
+_YES_ANSWERS = frozenset(['y', 'yes'])
+
+
+def _stdin_is_tty() -> bool:
+    """Check once whether stdin is an interactive terminal."""
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+_STDIN_IS_TTY = _stdin_is_tty()
+
+
+def get_column(survey_data: List[Dict[str, Any]], column: str) -> List[Any]:
+    """
+    Get all values of a column from survey data.
+    
+    Uses the shared columnar view when the data is a SurveyFrame, so the
+    column is extracted once for every analyzer instead of once per call.
+    
+    Args:
+        survey_data: List of dictionaries (or a SurveyFrame) of responses
+        column: Column name
+        
+    Returns:
+        List of values, with None where a row lacks the column
+    """
+    columns = getattr(survey_data, 'columns', None)
+    if isinstance(columns, dict):
+        values = columns.get(column)
+        return values if values is not None else [None] * len(survey_data)
+    return [row.get(column) for row in survey_data]
+
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # On POSIX terminals write the escape sequence `clear` itself would
+    # print (home, erase screen, erase scrollback) instead of starting a
+    # shell for it. Windows consoles, dumb terminals and redirected output
+    # keep the external command.
+    if not _IS_WINDOWS and os.environ.get('TERM', 'dumb') != 'dumb' and sys.stdout.isatty():
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
+        return
+    os.system(_CLEAR_COMMAND)
 
 
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "=" * 60)
-    print(f"TARGET: {title}")
-    print("=" * 60)
+    sys.stdout.write(f"\n{_HEADER_RULE}\nTARGET: {title}\n{_HEADER_RULE}\n")
 
 
 def print_menu(options: List[str]):
     """Print a numbered menu."""
-    print("\nAvailable Options:")
-    for i, option in enumerate(options, 1):
-        print(f"   {i}. {option}")
+    # Written as one block rather than one print() per option
+    lines = ["\nAvailable Options:\n"]
+    lines.extend(f"   {i}. {option}\n" for i, option in enumerate(options, 1))
+    sys.stdout.write("".join(lines))
 
 
 def print_success(message: str):
@@ -59,14 +135,31 @@ def validate_file_path(file_path: str) -> bool:
     Returns:
         True if file is valid, False otherwise
     """
+    return _regular_file_stat(file_path) is not None
+
+
+def _regular_file_stat(file_path: str) -> Optional[os.stat_result]:
+    """
+    Stat a user-supplied file path with a single system call.
+    
+    Args:
+        file_path: Path to the file, surrounding whitespace is ignored
+        
+    Returns:
+        The stat result if the path is an existing regular file, None otherwise
+    """
     if not file_path or not isinstance(file_path, str):
-        return False
+        return None
     
     file_path = file_path.strip()
     if not file_path:
-        return False
+        return None
     
-    return os.path.exists(file_path) and os.path.isfile(file_path)
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
 
 
 def validate_csv_file(file_path: str) -> bool:
@@ -79,16 +172,22 @@ def validate_csv_file(file_path: str) -> bool:
     Returns:
         True if file is a valid CSV, False otherwise
     """
-    if not validate_file_path(file_path):
+    file_stat = _regular_file_stat(file_path)
+    if file_stat is None:
         return False
     
     # Check file extension
     if not file_path.lower().endswith('.csv'):
         return False
     
-    # Check file size (not empty and not too large)
+    # Check file size (not empty and not too large). The size comes from the
+    # stat above unless the path had surrounding whitespace, which the size
+    # check has always looked up unstripped
     try:
-        file_size = os.path.getsize(file_path)
+        if file_path == file_path.strip():
+            file_size = file_stat.st_size
+        else:
+            file_size = os.path.getsize(file_path)
         if file_size == 0:
             return False
         if file_size > 50 * 1024 * 1024:  # 50MB limit
@@ -150,28 +249,42 @@ def format_table(data: List[List[str]], headers: List[str] = None) -> str:
     else:
         all_rows = data
     
-    col_widths = []
-    for col in range(len(all_rows[0])):
-        max_width = max(len(str(row[col])) for row in all_rows)
-        col_widths.append(max_width)
+    # Measure each column in C: transpose one column at a time with itemgetter
+    col_widths = [max(map(len, map(str, map(itemgetter(col), all_rows))))
+                  for col in range(len(all_rows[0]))]
     
     # Build table
     lines = []
     
     # Header
     if headers:
-        header_line = " | ".join(f"{headers[i]:<{col_widths[i]}}" for i in range(len(headers)))
+        header_line = _format_table_row(headers, col_widths)
         lines.append(header_line)
         lines.append("-" * len(header_line))
     
     # Data rows
     for row in data:
-        row_line = " | ".join(f"{row[i]:<{col_widths[i]}}" for i in range(len(row)))
-        lines.append(row_line)
+        lines.append(_format_table_row(row, col_widths))
     
     return "\n".join(lines)
 
 
+def _format_table_row(row: List[Any], col_widths: List[int]) -> str:
+    """Left-align the cells of a table row to their column widths."""
+    # Widths are looked up by position so a row longer than the table still
+    # fails with IndexError instead of being cut short
+    return " | ".join(map(_pad_cell, row, map(col_widths.__getitem__, range(len(row)))))
+
+
+def _pad_cell(cell: Any, width: int) -> str:
+    """Left-align a cell, as f"{cell:<{width}}" does."""
+    # str.ljust gives the same result for strings without the format
+    # mini-language; other values keep their own __format__ (True -> '1')
+    if cell.__class__ is str:
+        return cell.ljust(width)
+    return f"{cell:<{width}}"
+
+
 def get_user_input(prompt: str, default: str = None) -> str:
     """
     Get user input with optional default value.
@@ -184,10 +297,34 @@ def get_user_input(prompt: str, default: str = None) -> str:
         User input string
     """
     if default:
-        user_input = input(f"{prompt} (default: {default}): ").strip()
+        user_input = _read_line(f"{prompt} (default: {default}): ").strip()
         return user_input if user_input else default
     else:
-        return input(f"{prompt}: ").strip()
+        return _read_line(f"{prompt}: ").strip()
+
+
+def _read_line(prompt: str) -> str:
+    """
+    Read one line of input after showing a prompt.
+    
+    Uses input() on a terminal, where it provides line editing, and reads
+    stdin directly when input is piped, raising EOFError at end of input
+    just as input() does.
+    
+    Args:
+        prompt: Prompt to display
+        
+    Returns:
+        The line read, without its trailing newline
+    """
+    if _STDIN_IS_TTY:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line[-1] == '\n' else line
 
 
 def confirm_action(prompt: str = "Are you sure?") -> bool:
@@ -200,8 +337,8 @@ def confirm_action(prompt: str = "Are you sure?") -> bool:
     Returns:
         True if user confirms, False otherwise
     """
-    response = input(f"{prompt} (y/N): ").strip().lower()
-    return response in ['y', 'yes']
+    response = _read_line(f"{prompt} (y/N): ").strip().lower()
+    return response in _YES_ANSWERS
 
 
 def display_progress(current: int, total: int, description: str = "Processing"):
@@ -216,15 +353,28 @@ def display_progress(current: int, total: int, description: str = "Processing"):
     if total == 0:
         return
     
+    # Redraw at most every _PROGRESS_INTERVAL seconds; the final update is
+    # always shown, and resets the clock so the next bar starts drawn
+    now = time.monotonic()
+    finished = current == total
+    if not finished and now - _last_progress_draw[0] < _PROGRESS_INTERVAL:
+        return
+    _last_progress_draw[0] = 0.0 if finished else now
+    
     percentage = (current / total) * 100
-    bar_length = 30
+    bar_length = _BAR_LENGTH
     filled_length = int(bar_length * current // total)
-    bar = '█' * filled_length + '-' * (bar_length - filled_length)
-    
-    print(f"\r{description}: |{bar}| {percentage:.1f}% ({current}/{total})", end='')
+    if 0 <= filled_length <= bar_length:
+        bar = _BAR_FILLED[:filled_length] + _BAR_EMPTY[filled_length:]
+    else:
+        # Out-of-range progress keeps the old overlong/short bar
+        bar = '█' * filled_length + '-' * (bar_length - filled_length)
     
-    if current == total:
-        print()  # New line when complete
+    line = f"\r{description}: |{bar}| {percentage:.1f}% ({current}/{total})"
+    if finished:
+        line += "\n"  # New line when complete
+    sys.stdout.write(line)
+    sys.stdout.flush()
 
 
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
@@ -274,13 +424,13 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # Pick the largest unit the size reaches and scale once; dividing by a
+    # power of two is exact, so this equals dividing by 1024 step by step
+    for unit, scale in _FILE_SIZE_UNITS:
+        if size_bytes >= scale:
+            return f"{size_bytes / scale:.1f} {unit}"
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes:.1f} B"
 
 
 def validate_age(age_str: str) -> bool:
@@ -293,6 +443,14 @@ def validate_age(age_str: str) -> bool:
     Returns:
         True if valid age, False otherwise
     """
+    # Plain digit strings are parsed without the try, and strings that can't
+    # start a number are rejected before int() has to raise. Anything else
+    # (signs, spacing, underscores, long or non-str input) is left to int()
+    if age_str.__class__ is str:
+        if len(age_str) <= 3 and age_str.isdecimal():
+            return int(age_str) <= 120
+        if not age_str.strip().lstrip('+-')[:1].isdecimal():
+            return False
     try:
         age = int(age_str)
         return 0 <= age <= 120
@@ -313,12 +471,7 @@ def validate_gender(gender_str: str) -> bool:
     if not gender_str:
         return False
     
-    valid_genders = [
-        'male', 'female', 'm', 'f', 'other', 'prefer not to say',
-        'Male', 'Female', 'M', 'F', 'Other', 'Prefer not to say'
-    ]
-    
-    return gender_str.strip() in valid_genders
+    return gender_str.strip() in _VALID_GENDERS
 
 
 def normalize_text(text: str) -> str:
@@ -334,8 +487,9 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace and convert to lowercase
-    normalized = " ".join(text.strip().split()).lower()
+    # Remove extra whitespace and convert to lowercase; split() already
+    # drops leading and trailing whitespace, so no strip() pass is needed
+    normalized = " ".join(text.split()).lower()
     return normalized
 
 
@@ -355,10 +509,14 @@ def count_words(text: str) -> int:
     return len(text.split())
 
 
+@lru_cache(maxsize=1024)
 def get_file_extension(file_path: str) -> str:
     """
     Get file extension from file path.
     
+    Cached, since validators inspect the same paths repeatedly; splitext is
+    kept for its handling of leading dots ('.env' has no extension).
+    
     Args:
         file_path: Path to file
         
@@ -379,13 +537,19 @@ def ensure_directory_exists(directory_path: str) -> bool:
         True if directory exists or was created, False otherwise
     """
     try:
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)
+        os.makedirs(directory_path, exist_ok=True)
         return True
-    except Exception:
+    except OSError:
         return False
 
 
+def available_cpus() -> int:
+    """Count the CPUs this process may run on (not all CPUs of the machine)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def is_valid_filename(filename: str) -> bool:
     """
     Check if a filename is valid.
@@ -400,8 +564,7 @@ def is_valid_filename(filename: str) -> bool:
         return False
     
     # Check for invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    return not any(char in filename for char in invalid_chars)
+    return _INVALID_FILENAME_CHARS.isdisjoint(filename)
 
 
 def format_duration(seconds: float) -> str:
@@ -438,8 +601,7 @@ def print_bullet_list(items: List[str], indent: int = 2):
         indent: Number of spaces to indent
     """
     indent_str = " " * indent
-    for item in items:
-        print(f"{indent_str}- {item}")
+    sys.stdout.write("".join([f"{indent_str}- {item}\n" for item in items]))
 
 
 def print_key_value_pairs(data: Dict[str, Any], indent: int = 2):
@@ -451,5 +613,4 @@ def print_key_value_pairs(data: Dict[str, Any], indent: int = 2):
         indent: Number of spaces to indent
     """
     indent_str = " " * indent
-    for key, value in data.items():
-        print(f"{indent_str}{key}: {value}") 
\ No newline at end of file
+    sys.stdout.write("".join([f"{indent_str}{key}: {value}\n" for key, value in data.items()])) 
\ No newline at end of file